@@ -0,0 +1,50 @@
+import functools
+import nltk
+
+class _PeriodSentenceSplitter:
+    """Fallback used when no Punkt model can be loaded: splits on periods"""
+    def tokenize(self, text):
+        return [s.strip() for s in text.split('.') if s.strip()]
+
+@functools.lru_cache(maxsize=1)
+def get_sentence_tokenizer():
+    """
+    Load the English Punkt sentence tokenizer once and share it between modules
+    
+    Returns:
+        The Punkt tokenizer instance, or a period-splitting fallback if no Punkt
+        model is available (the fallback is cached too, so loading isn't retried per call)
+    """
+    try:
+        # NLTK >= 3.8.2 ships Punkt as the 'punkt_tab' resource
+        return nltk.tokenize.PunktTokenizer("english")
+    except (AttributeError, LookupError):
+        pass
+    
+    try:
+        # Older NLTK releases; NLTK >= 3.9 refuses to load pickled models
+        return nltk.data.load('tokenizers/punkt/english.pickle')
+    except Exception as e:
+        print(f"Warning: Punkt sentence tokenizer unavailable, splitting on periods: {str(e)}")
+        return _PeriodSentenceSplitter()
+
+def split_sentences(text):
+    """
+    Split text into sentences with the shared Punkt tokenizer
+    
+    Args:
+        text (str): Text to split
+        
+    Returns:
+        list: List of sentence strings
+    """
+    return get_sentence_tokenizer().tokenize(text)
+
+def has_punkt():
+    """
+    Check whether sentences are split with a real Punkt model
+    
+    Returns:
+        bool: False if the period-splitting fallback is in use
+    """
+    return not isinstance(get_sentence_tokenizer(), _PeriodSentenceSplitter)
@@ -1,27 +1,74 @@
 import streamlit as st
 import tempfile
 import os
-import nltk
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
 import json
 import io
 import time
 import mimetypes
 import logging
-from pydub import AudioSegment
+import subprocess
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Size of the chunks fed to ffmpeg's stdin (8 MB)
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Sample rate uploads are converted to before being sent to the server
+TARGET_SAMPLE_RATE = 16000
+
+# Containers libsndfile decodes in-process, so they are converted without spawning ffmpeg
+SOUNDFILE_FORMATS = frozenset({"WAV", "FLAC", "AIFF", "OGG"})
+
+# Longest the UI waits for a background audio conversion before sending the original file
+CONVERSION_TIMEOUT_SECONDS = 600
+
+# Progress bar bands: conversion moves the bar from CONVERSION_PROGRESS_START to
+# UPLOAD_PROGRESS, and the server job's own 0-100% progress fills the rest
+CONVERSION_PROGRESS_START = 5
+UPLOAD_PROGRESS = 40
+
+# Seconds the server holds a job-status long-poll open
+LONG_POLL_SECONDS = 25
+
+# Seconds a server health check result is reused across reruns
+HEALTH_CHECK_TTL = 5
+
+# Seconds search results are cached, and the shortest query worth sending
+SEARCH_CACHE_TTL = 300
+MIN_SEARCH_QUERY_LENGTH = 3
+
+# Most searches kept in the cache, which all sessions share (old entries are evicted
+# instead of clearing the whole cache)
+SEARCH_CACHE_MAX_ENTRIES = 256
+
 # Set page title and configuration
 st.set_page_config(page_title="AI Meeting Summarizer", layout="wide")
 st.title("AI Meeting Summarizer")
 
-# Check if server is running
+# Persistent, pooled session so every call to the FastAPI server reuses keep-alive connections.
+# Cached as a resource because Streamlit re-executes this script on every rerun.
+@st.cache_resource(show_spinner=False)
+def get_session():
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+SESSION = get_session()
+
+# Check if server is running (cached briefly so reruns don't re-ping the server)
+@st.cache_data(ttl=HEALTH_CHECK_TTL, show_spinner=False)
 def is_server_running():
     try:
-        response = requests.get("http://localhost:8000/health", timeout=2)
+        response = SESSION.get("http://localhost:8000/health", timeout=2)
         return response.status_code == 200
     except:
         return False
@@ -36,49 +83,203 @@ with st.sidebar:
         st.error("❌ FastAPI Server Offline")
         st.info("Please run 'python server.py' in a separate terminal")
 
-# Ensure NLTK dependencies are downloaded
-@st.cache_resource
-def safe_convert_audio(audio_file):
+# Background worker for audio conversion so the UI keeps updating while ffmpeg runs
+@st.cache_resource(show_spinner=False)
+def get_executor():
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="audio-conversion")
+
+# Search the processed transcript; results_id only keys the cache per processed meeting
+@st.cache_data(ttl=SEARCH_CACHE_TTL, max_entries=SEARCH_CACHE_MAX_ENTRIES, show_spinner=False)
+def search_transcript(results_id, query):
+    response = SESSION.post(
+        "http://localhost:8000/search/",
+        json={"query": query},
+        timeout=30
+    )
+    response.raise_for_status()
+    return response.json().get("results", [])
+
+def job_progress(progress):
+    """Scale the server job's 0-100 progress into the part of the bar after the upload"""
+    return UPLOAD_PROGRESS + int(progress) * (100 - UPLOAD_PROGRESS) // 100
+
+def _feed_stdin(audio_file, stdin, progress_callback=None):
+    """Write a file-like object to a subprocess stdin in CHUNK_SIZE pieces"""
+    try:
+        total_size = len(audio_file.getbuffer())
+        written = 0
+        audio_file.seek(0)
+        while True:
+            chunk = audio_file.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            stdin.write(chunk)
+            written += len(chunk)
+            if progress_callback and total_size:
+                progress_callback(written / total_size)
+    except (BrokenPipeError, OSError):
+        # ffmpeg exited early; its stderr carries the actual error
+        pass
+    finally:
+        stdin.close()
+
+class BufferReader:
+    """
+    Read-only file-like view over an in-memory buffer, for streaming it with MultipartEncoder.
+    It has no getvalue() on purpose: requests-toolbelt copies objects that have one
+    (BytesIO, Streamlit's UploadedFile) into a new buffer before sending.
+    """
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+    
+    @property
+    def len(self):
+        # Bytes left to read; the encoder uses this to size and drain the part
+        return len(self._view) - self._position
+    
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.len
+        chunk = self._view[self._position:self._position + size].tobytes()
+        self._position += len(chunk)
+        return chunk
+
+def extract_video_audio(video_file):
+    """
+    Extract the audio track of a video file-like object as 16kHz mono WAV bytes.
+    The video is piped to ffmpeg in memory; containers that need seeking (e.g. MP4
+    with its index at the end) fall back to a temporary file.
+    """
+    input_args = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-i"]
+    output_args = ["-vn", "-ac", "1", "-ar", "16000", "-f", "wav", "pipe:1"]
+    
+    try:
+        return subprocess.run(
+            input_args + ["pipe:0"] + output_args,
+            input=video_file.getbuffer(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True
+        ).stdout
+    except subprocess.CalledProcessError:
+        logger.info("Could not extract audio from a pipe, retrying from a temporary file")
+    
+    with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(video_file.name)[1]) as temp_video:
+        temp_video.write(video_file.getbuffer())
+        temp_video_path = temp_video.name
+    try:
+        return subprocess.run(
+            input_args + [temp_video_path] + output_args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True
+        ).stdout
+    finally:
+        os.unlink(temp_video_path)
+
+def is_normalized_wav(header):
+    """Check whether a file header belongs to a 16-bit PCM, mono, 16kHz WAV file"""
+    if len(header) < 36 or header[:4] != b"RIFF" or header[8:12] != b"WAVE" or header[12:16] != b"fmt ":
+        return False
+    audio_format, channels, sample_rate, _, _, bits_per_sample = struct.unpack("<HHIIHH", header[20:36])
+    return audio_format == 1 and channels == 1 and sample_rate == 16000 and bits_per_sample == 16
+
+def convert_with_soundfile(audio_file):
+    """
+    Decode a WAV/FLAC/AIFF/OGG file-like object with libsndfile and re-encode it
+    as 16kHz mono FLAC. Returns None if the format is not handled natively.
+    """
+    # Imported lazily: only the conversion path needs them, and they slow down first paint
+    import numpy as np
+    import soundfile as sf
+    import soxr
+    
     try:
-        # Convert audio using pydub
-        audio = AudioSegment.from_file(audio_file)
-        # Convert to WAV format with standard parameters
-        buffer = io.BytesIO()
-        audio.export(buffer, format='wav', parameters=['-ac', '1', '-ar', '16000'])
+        audio_file.seek(0)
+        if sf.info(audio_file).format not in SOUNDFILE_FORMATS:
+            return None
+        audio_file.seek(0)
+        data, sample_rate = sf.read(audio_file, dtype="float32", always_2d=True)
+    except RuntimeError:
+        # libsndfile can't read this file; let ffmpeg handle it
+        return None
+    
+    mono = data.mean(axis=1, dtype=np.float32) if data.shape[1] > 1 else data[:, 0]
+    if sample_rate != TARGET_SAMPLE_RATE:
+        mono = soxr.resample(mono, sample_rate, TARGET_SAMPLE_RATE)
+    
+    buffer = io.BytesIO()
+    sf.write(buffer, mono, TARGET_SAMPLE_RATE, format="FLAC", subtype="PCM_16")
+    return buffer.getvalue()
+
+def convert_with_ffmpeg(audio_file, progress_callback=None):
+    """Stream a file-like object through ffmpeg and return 16kHz mono FLAC bytes"""
+    # ffmpeg's errors go to a temp file so a full stderr pipe can never stall stdout
+    with tempfile.TemporaryFile() as error_file:
+        process = subprocess.Popen(
+            ["ffmpeg", "-hide_banner", "-loglevel", "error",
+             "-i", "pipe:0",
+             "-ac", "1", "-ar", str(TARGET_SAMPLE_RATE),
+             "-f", "flac", "pipe:1"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=error_file
+        )
+        writer = threading.Thread(
+            target=_feed_stdin,
+            args=(audio_file, process.stdin, progress_callback),
+            daemon=True
+        )
+        writer.start()
+        converted_bytes = process.stdout.read()
+        process.wait()
+        writer.join()
+        error_file.seek(0)
+        ffmpeg_error = error_file.read()
+    
+    if process.returncode != 0 or not converted_bytes:
+        raise RuntimeError(ffmpeg_error.decode(errors="replace").strip() or "ffmpeg produced no output")
+    
+    return converted_bytes
+
+def safe_convert_audio(audio_file, progress_callback=None):
+    """
+    Convert an audio file-like object to 16kHz mono FLAC bytes.
+    FLAC is lossless but typically 2-3x smaller than PCM WAV for speech, so less
+    data is sent to the server. Uploads that are already 16kHz mono PCM WAV are
+    passed through untouched, formats libsndfile understands are converted
+    in-process, and everything else goes through ffmpeg.
+    progress_callback, if given, receives the fraction (0-1) of input converted.
+    """
+    try:
+        buffer = audio_file.getbuffer()
+        if is_normalized_wav(bytes(buffer[:36])):
+            return buffer, {
+                "converted_size": len(buffer),
+                "format": "wav",
+                "channels": 1,
+                "sample_rate": TARGET_SAMPLE_RATE,
+                "passthrough": True
+            }
+        
+        converted_bytes = convert_with_soundfile(audio_file)
+        if converted_bytes is not None:
+            if progress_callback:
+                progress_callback(1.0)
+        else:
+            converted_bytes = convert_with_ffmpeg(audio_file, progress_callback)
         
         conversion_info = {
-            "converted_size": len(buffer.getvalue()),
-            "format": "wav",
+            "converted_size": len(converted_bytes),
+            "format": "flac",
             "channels": 1,
-            "sample_rate": 16000
+            "sample_rate": TARGET_SAMPLE_RATE
         }
         
-        return buffer.getvalue(), conversion_info
-    except Exception as e:
-        return audio_file.getvalue(), {"error": str(e)}
-
-def download_nltk_data():
-    try:
-        # Check if NLTK data is already downloaded
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt')
-            
-        try:
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('stopwords')
-            
-        try:
-            nltk.data.find('sentiment/vader_lexicon.zip')
-        except LookupError:
-            nltk.download('vader_lexicon')
+        return converted_bytes, conversion_info
     except Exception as e:
-        st.warning(f"Could not download NLTK data: {str(e)}. Some features may be limited.")
-
-# Download NLTK data
-download_nltk_data()
+        return audio_file.getbuffer(), {"error": str(e)}
 
 # Initialize session state variables if they don't exist
 if 'transcript' not in st.session_state:
@@ -97,6 +298,10 @@ if 'debug_info' not in st.session_state:
     st.session_state.debug_info = None
 if 'file_info' not in st.session_state:
     st.session_state.file_info = None
+if 'conversion' not in st.session_state:
+    st.session_state.conversion = None
+if 'results_id' not in st.session_state:
+    st.session_state.results_id = None
 
 # Show sidebar with options
 with st.sidebar:
@@ -116,27 +321,18 @@ uploaded_file = st.file_uploader("Upload an audio/video file", type=["mp3", "wav
 if uploaded_file is not None and uploaded_file.type and 'video' in uploaded_file.type:
     try:
         st.info("Processing video file to extract audio...")
-        # Save video to temp file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_file.name)[1]) as temp_video:
-            temp_video.write(uploaded_file.getvalue())
-            temp_video_path = temp_video.name
-
-        # Extract audio using pydub
-        video_audio = AudioSegment.from_file(temp_video_path)
+        video_name = uploaded_file.name
         
-        # Create temporary file for audio
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as temp_audio:
-            video_audio.export(temp_audio.name, format='wav')
-            # Read the extracted audio
-            with open(temp_audio.name, 'rb') as audio_file:
-                uploaded_file = st.BytesIO(audio_file.read())
-                uploaded_file.name = os.path.splitext(uploaded_file.name)[0] + '.wav'
-                uploaded_file.type = 'audio/wav'
-
-        # Clean up temp files
-        os.unlink(temp_video_path)
-        os.unlink(temp_audio.name)
+        # Extract the audio track, in memory unless the container needs seeking
+        audio_bytes = extract_video_audio(uploaded_file)
         
+        uploaded_file = io.BytesIO(audio_bytes)
+        uploaded_file.name = os.path.splitext(video_name)[0] + '.wav'
+        uploaded_file.type = 'audio/wav'
+        
+    except subprocess.CalledProcessError as e:
+        st.error(f"Error extracting audio from video: {e.stderr.decode(errors='replace').strip()}")
+        uploaded_file = None
     except Exception as e:
         st.error(f"Error extracting audio from video: {str(e)}")
         uploaded_file = None
@@ -147,7 +343,7 @@ if debug_mode and uploaded_file is not None:
     st.sidebar.subheader("File Information")
     file_info = {
         "Filename": uploaded_file.name,
-        "Size": f"{len(uploaded_file.getvalue())} bytes",
+        "Size": f"{len(uploaded_file.getbuffer())} bytes",
         "Type": uploaded_file.type if hasattr(uploaded_file, 'type') and uploaded_file.type else "Unknown"
     }
     
@@ -188,65 +384,94 @@ if uploaded_file is not None:
                 
                 debug_info = {
                     "original_filename": uploaded_file.name,
-                    "original_file_size": len(uploaded_file.getvalue())
+                    "original_file_size": len(uploaded_file.getbuffer())
                 }
                 
-                file_bytes = uploaded_file.getvalue()
+                # Send the upload itself unless conversion produces a new file
+                upload_data = uploaded_file.getbuffer()
                 mime_type = uploaded_file.type or f"audio/{uploaded_file.name.split('.')[-1]}"
                 filename = uploaded_file.name
                 
                 # Convert audio if enabled
                 if convert_audio:
                     status_text.text("Converting audio to optimize for transcription...")
-                    progress_bar.progress(8)
+                    progress_bar.progress(CONVERSION_PROGRESS_START)
                     
                     try:
-                        file_bytes, conversion_info = safe_convert_audio(uploaded_file)
+                        # Run the conversion in the background, reusing one already started
+                        # for this file if a rerun interrupted the previous attempt
+                        conversion_key = (uploaded_file.name, debug_info["original_file_size"])
+                        conversion = st.session_state.conversion
+                        if conversion is None or conversion["key"] != conversion_key:
+                            conversion_progress = {"fraction": 0.0}
+                            conversion = {
+                                "key": conversion_key,
+                                "progress": conversion_progress,
+                                "future": get_executor().submit(
+                                    safe_convert_audio,
+                                    uploaded_file,
+                                    lambda fraction: conversion_progress.update(fraction=fraction)
+                                )
+                            }
+                            st.session_state.conversion = conversion
+                        
+                        deadline = time.time() + CONVERSION_TIMEOUT_SECONDS
+                        while not conversion["future"].done():
+                            if time.time() > deadline:
+                                raise TimeoutError(f"conversion took longer than {CONVERSION_TIMEOUT_SECONDS} seconds")
+                            percent = int(conversion["progress"]["fraction"] * 100)
+                            status_text.text(f"Converting audio to optimize for transcription... {percent}%")
+                            progress_bar.progress(
+                                CONVERSION_PROGRESS_START + percent * (UPLOAD_PROGRESS - CONVERSION_PROGRESS_START) // 100
+                            )
+                            time.sleep(0.1)
+                        
+                        st.session_state.conversion = None
+                        converted_bytes, conversion_info = conversion["future"].result()
                         debug_info.update(conversion_info)
                         
                         if "error" in conversion_info:
                             status_text.text(f"Audio conversion warning: {conversion_info['error']}. Proceeding anyway...")
                         else:
                             status_text.text("Audio conversion successful")
-                        
-                        # Update MIME type and filename for the converted file
-                        mime_type = "audio/wav" 
-                        filename = os.path.splitext(uploaded_file.name)[0] + ".wav"
+                            
+                            # Update file, MIME type and filename for the converted file
+                            if not conversion_info.get("passthrough"):
+                                upload_data = converted_bytes
+                            mime_type = f"audio/{conversion_info['format']}"
+                            filename = os.path.splitext(uploaded_file.name)[0] + f".{conversion_info['format']}"
                         
                     except Exception as e:
+                        st.session_state.conversion = None
                         status_text.text(f"Audio conversion failed: {str(e)}. Using original file...")
                         logger.error(f"Error converting audio: {str(e)}")
                         # Continue with original file if conversion fails
-                        uploaded_file.seek(0)
-                        file_bytes = uploaded_file.getvalue()
                         debug_info["conversion_error"] = str(e)
                 
                 # Update status  
                 status_text.text("Sending file to processing server...")
-                progress_bar.progress(10)
+                progress_bar.progress(UPLOAD_PROGRESS)
                 
                 if debug_mode:
                     debug_info["mime_type_sent"] = mime_type
                     debug_info["filename_sent"] = filename
                 
-                # Prepare the form data
-                files = {
-                    "file": (filename, io.BytesIO(file_bytes), mime_type)
-                }
-                
-                data = {
+                # Prepare the form data as a streaming multipart body so the file is
+                # read in chunks while sending instead of being buffered up front
+                encoder = MultipartEncoder(fields={
+                    "file": (filename, BufferReader(upload_data), mime_type),
                     "options": json.dumps({
                         "num_summary_points": num_summary_points,
                         "summary_style": summary_style,
                         "debug": debug_mode
                     })
-                }
+                })
                 
                 # Send the request to the FastAPI server
-                response = requests.post(
+                response = SESSION.post(
                     "http://localhost:8000/process-audio/",
-                    files=files,
-                    data=data,
+                    data=encoder,
+                    headers={"Content-Type": encoder.content_type},
                     timeout=60  # 1 minute timeout for initial upload
                 )
                 
@@ -265,9 +490,20 @@ if uploaded_file is not None:
                     max_wait_time = 20 * 60  # 20 minute maximum wait time
                     start_time = time.time()
                     
+                    last_progress = -1
+                    
                     while time.time() - start_time < max_wait_time:
-                        # Get job status
-                        status_response = requests.get(f"http://localhost:8000/job-status/{job_id}", timeout=10)
+                        # Long-poll job status: the server answers as soon as progress moves past last_progress
+                        try:
+                            status_response = SESSION.get(
+                                f"http://localhost:8000/job-status-wait/{job_id}",
+                                params={"since": last_progress, "timeout": LONG_POLL_SECONDS},
+                                timeout=LONG_POLL_SECONDS + 5
+                            )
+                        except requests.exceptions.ReadTimeout:
+                            # The server didn't answer within the long-poll window; poll again
+                            # (the loop condition still bounds the total wait)
+                            continue
                         
                         if status_response.status_code == 200:
                             status_data = status_response.json()
@@ -284,14 +520,14 @@ if uploaded_file is not None:
                                 st.session_state.transcript = results.get("transcript")
                                 st.session_state.summary = results.get("summary")
                                 st.session_state.sentiment = results.get("sentiment")
+                                st.session_state.results_id = job_id
                                 
                                 progress_bar.progress(100)
                                 status_text.text("Processing complete!")
                                 
-                                # Force a rerun to update the UI
+                                # The results section further down renders them in this same run
                                 st.session_state.processing = False
                                 st.session_state.job_id = None
-                                st.rerun()
                                 break
                                 
                             elif status_data.get("status") == "error":
@@ -312,12 +548,10 @@ if uploaded_file is not None:
                                 # Process is still running, update progress
                                 progress = status_data.get("progress", 0)
                                 message = status_data.get("message", "Processing...")
+                                last_progress = progress
                                 
-                                progress_bar.progress(progress)
+                                progress_bar.progress(job_progress(progress))
                                 status_text.text(message)
-                                
-                                # Sleep before next poll
-                                time.sleep(2)
                         else:
                             st.error(f"Error checking job status: {status_response.status_code} - {status_response.text}")
                             st.session_state.processing = False
@@ -351,7 +585,7 @@ if st.session_state.processing and st.session_state.job_id:
         
         try:
             # Get job status
-            status_response = requests.get(f"http://localhost:8000/job-status/{st.session_state.job_id}", timeout=10)
+            status_response = SESSION.get(f"http://localhost:8000/job-status/{st.session_state.job_id}", timeout=10)
             
             if status_response.status_code == 200:
                 status_data = status_response.json()
@@ -362,14 +596,14 @@ if st.session_state.processing and st.session_state.job_id:
                     st.session_state.transcript = results.get("transcript")
                     st.session_state.summary = results.get("summary")
                     st.session_state.sentiment = results.get("sentiment")
+                    st.session_state.results_id = st.session_state.job_id
                     
                     progress_bar.progress(100)
                     status_text.text("Processing complete!")
                     
-                    # Update session state
+                    # Update session state; the results section below renders them in this run
                     st.session_state.processing = False
                     st.session_state.job_id = None
-                    st.rerun()
                     
                 elif status_data.get("status") == "error":
                     # Process error
@@ -384,7 +618,7 @@ if st.session_state.processing and st.session_state.job_id:
                     progress = status_data.get("progress", 0)
                     message = status_data.get("message", "Processing...")
                     
-                    progress_bar.progress(progress)
+                    progress_bar.progress(job_progress(progress))
                     status_text.text(message)
                     
                     # Add a cancel button
@@ -414,27 +648,25 @@ if st.session_state.transcript is not None:
     
     # Search functionality
     st.subheader("Search Meeting Content")
-    search_query = st.text_input("Search the meeting transcript:")
-    if search_query:
+    search_query = st.text_input("Search the meeting transcript:").strip()
+    if search_query and len(search_query) < MIN_SEARCH_QUERY_LENGTH:
+        st.info(f"Enter at least {MIN_SEARCH_QUERY_LENGTH} characters to search.")
+    elif search_query:
         if not is_server_running():
             st.error("Cannot search: FastAPI server is not running")
         else:
             try:
-                # Call the search endpoint
-                search_response = requests.post(
-                    "http://localhost:8000/search/",
-                    json={"query": search_query}
-                )
-                
-                if search_response.status_code == 200:
-                    search_results = search_response.json().get("results", [])
-                    st.write(f"Found {len(search_results)} relevant segments:")
-                    for result in search_results:
-                        st.markdown(f"- *{result['sentence']}* (Relevance: {result['score']:.2f})")
-                else:
-                    st.error(f"Error searching transcript: {search_response.status_code} - {search_response.text}")
+                # Call the search endpoint (repeated queries are served from the cache)
+                search_results = search_transcript(st.session_state.results_id, search_query)
+                st.write(f"Found {len(search_results)} relevant segments:")
+                for result in search_results:
+                    st.markdown(f"- *{result['sentence']}* (Relevance: {result['score']:.2f})")
+            except requests.exceptions.HTTPError as e:
+                st.error(f"Error searching transcript: {e.response.status_code} - {e.response.text}")
             except requests.exceptions.ConnectionError:
                 st.error("Failed to connect to the search server. Make sure the FastAPI server is running.")
+            except requests.exceptions.RequestException as e:
+                st.error(f"Error searching transcript: {str(e)}")
     
     if st.session_state.summary is not None:
         st.subheader("Meeting Summary")
@@ -444,22 +676,27 @@ if st.session_state.transcript is not None:
         st.subheader("Sentiment Analysis")
         col1, col2 = st.columns(2)
         
+        # Bind the nested result dicts once instead of going through session state per metric
+        sentiment = st.session_state.sentiment
+        
         with col1:
-            st.metric("Overall Sentiment", st.session_state.sentiment["Overall Sentiment"])
-            if "Compound Score" in st.session_state.sentiment:
-                st.metric("Compound Score", f"{st.session_state.sentiment['Compound Score']:.2f}")
+            st.metric("Overall Sentiment", sentiment["Overall Sentiment"])
+            if "Compound Score" in sentiment:
+                st.metric("Compound Score", f"{sentiment['Compound Score']:.2f}")
         
         with col2:
-            st.metric("Positive", f"{float(st.session_state.sentiment['Positive'].strip('%')):.2f}")
-            st.metric("Negative", f"{float(st.session_state.sentiment['Negative'].strip('%')):.2f}")
-            st.metric("Neutral", f"{float(st.session_state.sentiment['Neutral'].strip('%')):.2f}")
-            st.metric("Positive Sentences", st.session_state.sentiment["Stats"]["Positive Sentences"])
-            st.metric("Negative Sentences", st.session_state.sentiment["Stats"]["Negative Sentences"])
-            st.metric("Neutral Sentences", st.session_state.sentiment["Stats"]["Neutral Sentences"])
-            st.metric("Average Positive Score", f"{st.session_state.sentiment['Stats']['Average Scores']['Positive']:.2f}")
-            st.metric("Average Negative Score", f"{st.session_state.sentiment['Stats']['Average Scores']['Negative']:.2f}")
-            st.metric("Average Neutral Score", f"{st.session_state.sentiment['Stats']['Average Scores']['Neutral']:.2f}")
-            st.metric("Total Sentences", st.session_state.sentiment["Stats"]["Total Sentences"])
+            stats = sentiment["Stats"]
+            average_scores = stats["Average Scores"]
+            st.metric("Positive", f"{sentiment['Positive'] * 100:.2f}%")
+            st.metric("Negative", f"{sentiment['Negative'] * 100:.2f}%")
+            st.metric("Neutral", f"{sentiment['Neutral'] * 100:.2f}%")
+            st.metric("Positive Sentences", stats["Positive Sentences"])
+            st.metric("Negative Sentences", stats["Negative Sentences"])
+            st.metric("Neutral Sentences", stats["Neutral Sentences"])
+            st.metric("Average Positive Score", f"{average_scores['Positive']:.2f}")
+            st.metric("Average Negative Score", f"{average_scores['Negative']:.2f}")
+            st.metric("Average Neutral Score", f"{average_scores['Neutral']:.2f}")
+            st.metric("Total Sentences", stats["Total Sentences"])
 
 # Add a refresh button
 if st.session_state.transcript is not None:
@@ -472,6 +709,7 @@ if st.session_state.transcript is not None:
         st.session_state.job_id = None
         st.session_state.error_message = None
         st.session_state.debug_info = None
+        st.session_state.results_id = None
         st.rerun()
 
 # Add footer
@@ -1,7 +1,50 @@
+import io
 import os
 import sys
-import magic
 import time
+import contextlib
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+# Common audio file signatures (raw header bytes -> format name)
+AUDIO_SIGNATURES = (
+    (b"ID3", "MP3 with ID3v2 tag"),
+    (b"\xff\xfb", "MP3 frame sync"),
+    (b"\xff\xf3", "MP3 frame sync"),
+    (b"\xff\xf2", "MP3 frame sync"),
+    (b"\xff\xfe", "MP3 frame sync"),
+    (b"RIFF", "WAV/RIFF format"),
+    (b"OggS", "Ogg format"),
+    (b"fLaC", "FLAC format"),
+)
+
+# Signatures grouped by their first byte so a header is only compared against plausible candidates
+_SIGNATURES_BY_FIRST_BYTE = {}
+for _sig, _format_name in AUDIO_SIGNATURES:
+    _SIGNATURES_BY_FIRST_BYTE.setdefault(_sig[0], []).append((_sig, _format_name))
+
+def detect_header_format(header):
+    """
+    Identify an audio format from the first bytes of a file
+    
+    Args:
+        header: Raw bytes read from the start of the file
+        
+    Returns:
+        The format name, or None if the header is not recognized
+    """
+    if not header:
+        return None
+    
+    for sig, format_name in _SIGNATURES_BY_FIRST_BYTE.get(header[0], ()):
+        if header.startswith(sig):
+            return format_name
+    
+    # MP4/M4A containers carry their 'ftyp' box after a 4-byte size field
+    if header[4:8] == b"ftyp":
+        return "MP4/M4A container"
+    
+    return None
 
 def check_audio_file(filepath):
     """
@@ -24,6 +67,7 @@ def check_audio_file(filepath):
     # Check if file exists
     if not os.path.exists(filepath):
         results["issues"].append("File does not exist")
+        print("File does not exist")
         return results
     
     results["file_exists"] = True
@@ -52,7 +96,11 @@ def check_audio_file(filepath):
     
     # Get MIME type using python-magic
     try:
-        mime = magic.Magic(mime=True)
+        # Imported here so check_audio_files workers don't load PyAV and libmagic at startup
+        from file_validation import get_magic
+        mime = get_magic()
+        if mime is None:
+            raise ImportError("python-magic is not installed")
         mime_type = mime.from_file(filepath)
         results["mime_type"] = mime_type
         print(f"MIME type: {mime_type}")
@@ -78,30 +126,14 @@ def check_audio_file(filepath):
     # Try to check file header
     try:
         with open(filepath, 'rb') as f:
-            header = f.read(16).hex()
-            print(f"File header (hex): {header}")
+            header = f.read(16)
+            print(f"File header (hex): {header.hex()}")
             
             # Check for common audio format headers
-            headers = {
-                "4944330": "MP3 with ID3v2 tag",
-                "fffb": "MP3 frame sync",
-                "fff3": "MP3 frame sync",
-                "fff2": "MP3 frame sync",
-                "fffe": "MP3 frame sync",
-                "52494646": "WAV/RIFF format",
-                "4f676753": "Ogg format",
-                "664c6143": "FLAC format",
-                "6674797069": "MP4/M4A container"
-            }
-            
-            format_detected = False
-            for sig, format_name in headers.items():
-                if header.startswith(sig):
-                    print(f"Detected format: {format_name}")
-                    format_detected = True
-                    break
-            
-            if not format_detected:
+            format_name = detect_header_format(header)
+            if format_name:
+                print(f"Detected format: {format_name}")
+            else:
                 results["issues"].append("File header doesn't match common audio formats")
     except Exception as e:
         results["issues"].append(f"Error checking file header: {str(e)}")
@@ -116,29 +148,33 @@ def check_audio_file(filepath):
     except Exception as e:
         results["issues"].append(f"Error getting file timestamps: {str(e)}")
     
-    # Try using ffprobe if available to get audio file info
-    try:
-        import subprocess
-        cmd = ["ffprobe", "-hide_banner", "-i", filepath, "-show_format", "-show_streams", "-v", "error"]
-        process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
-        if process.returncode == 0:
-            print("\nFFprobe detected media information:")
-            ffprobe_output = process.stdout.decode()
-            print(ffprobe_output)
+    # Try using ffprobe if available to get audio file info.
+    # Skipped for empty or unreadable files, where spawning it can only fail.
+    if results["file_size"] == 0 or not results["readable"]:
+        print("Skipping FFprobe: file is empty or unreadable")
+    else:
+        try:
+            cmd = ["ffprobe", "-hide_banner", "-i", filepath, "-show_format", "-show_streams", "-v", "error"]
+            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
             
-            if "Stream #0:0: Audio" in ffprobe_output or "Stream #0:0(und): Audio" in ffprobe_output:
-                print("FFprobe confirms this is a valid audio file")
+            if process.returncode == 0:
+                print("\nFFprobe detected media information:")
+                ffprobe_output = process.stdout.decode()
+                print(ffprobe_output)
+                
+                # -show_streams prints one "codec_type=..." line per stream
+                if "codec_type=audio" in ffprobe_output:
+                    print("FFprobe confirms this is a valid audio file")
+                else:
+                    results["issues"].append("FFprobe didn't detect an audio stream in this file")
             else:
-                results["issues"].append("FFprobe didn't detect an audio stream in this file")
-        else:
-            error = process.stderr.decode()
-            print(f"FFprobe error: {error}")
-            results["issues"].append(f"FFprobe couldn't process this file: {error}")
-    except FileNotFoundError:
-        print("FFprobe not installed or not in PATH - cannot check media info")
-    except Exception as e:
-        results["issues"].append(f"Error running FFprobe: {str(e)}")
+                error = process.stderr.decode()
+                print(f"FFprobe error: {error}")
+                results["issues"].append(f"FFprobe couldn't process this file: {error}")
+        except FileNotFoundError:
+            print("FFprobe not installed or not in PATH - cannot check media info")
+        except Exception as e:
+            results["issues"].append(f"Error running FFprobe: {str(e)}")
     
     # Summary
     print("\nIssues found:")
@@ -154,15 +190,50 @@ def check_audio_file(filepath):
         print(" - Try converting the file to WAV format using a tool like Audacity or FFmpeg")
         print(" - Make sure the file has audio content and isn't corrupt")
         print(" - Check if the file is password protected or encrypted")
-        print(" - Try a sample command: ffmpeg -i your_file -acodec pcm_s16le -ar 44100 -ac 1 output.wav")
+        print(" - Try a sample command: ffmpeg -i your_file -acodec pcm_s16le -ar 16000 -ac 1 output.wav")
     else:
         print(" - File appears to be a valid audio file")
     
     return results
 
+def _check_audio_file_report(filepath):
+    """Run check_audio_file, capturing its printed report instead of writing it to stdout"""
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        results = check_audio_file(filepath)
+    return results, report.getvalue()
+
+def check_audio_files(filepaths, max_workers=None):
+    """
+    Run check_audio_file over many files in parallel across CPU cores
+    
+    Each file's report is printed from this process, one file after another in
+    input order, so reports from different workers never interleave.
+    
+    Args:
+        filepaths: Paths of the audio files to check
+        max_workers: Number of worker processes (defaults to the CPU count)
+        
+    Returns:
+        dict mapping each path to its check_audio_file results
+    """
+    filepaths = list(filepaths)
+    if len(filepaths) <= 1:
+        return {path: check_audio_file(path) for path in filepaths}
+    
+    results = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for path, (file_results, report) in zip(filepaths, executor.map(_check_audio_file_report, filepaths)):
+            print(report)
+            results[path] = file_results
+    return results
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python check_audio.py <audio_file_path>")
+        print("Usage: python check_audio.py <audio_file_path> [<audio_file_path> ...]")
         sys.exit(1)
     
-    check_audio_file(sys.argv[1])
\ No newline at end of file
+    results = check_audio_files(sys.argv[1:])
+    
+    # Exit with an error status if any file has issues
+    sys.exit(1 if any(file_results["issues"] for file_results in results.values()) else 0)
\ No newline at end of file
@@ -2,6 +2,39 @@ import os
 import tempfile
 import mimetypes
 import platform
+import functools
+import subprocess
+import importlib.util
+
+# Optional dependencies are probed once at import time rather than on every call
+try:
+    import magic
+except ImportError:
+    magic = None
+
+try:
+    import av
+except ImportError:
+    av = None
+
+# librosa is slow to import and only needed as a last resort, so just check it exists
+_HAS_LIBROSA = importlib.util.find_spec("librosa") is not None
+
+# Common audio extensions
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.m4a', '.flac', '.aac', '.ogg', '.mp4', '.wma'})
+
+@functools.lru_cache(maxsize=None)
+def get_magic():
+    """
+    Get the shared python-magic MIME detector, creating it on first use so the
+    libmagic database is only loaded once per process
+    
+    Returns:
+        magic.Magic: MIME type detector, or None if python-magic isn't installed
+    """
+    if magic is None:
+        return None
+    return magic.Magic(mime=True)
 
 def validate_audio_file(file_path):
     """
@@ -10,6 +43,9 @@ def validate_audio_file(file_path):
     2. If the file has content
     3. If the file appears to be an audio file based on extension and content
     
+    Content checks run cheapest first and stop at the first conclusive answer;
+    librosa is only used when every other method was inconclusive.
+    
     Returns a tuple: (is_valid, message)
     """
     # Check if file exists
@@ -25,47 +61,43 @@ def validate_audio_file(file_path):
     _, extension = os.path.splitext(file_path)
     extension = extension.lower()
     
-    # List of common audio extensions
-    audio_extensions = ['.mp3', '.wav', '.m4a', '.flac', '.aac', '.ogg', '.mp4', '.wma']
-    
-    if extension not in audio_extensions:
+    if extension not in AUDIO_EXTENSIONS:
         return False, f"File extension '{extension}' does not appear to be a supported audio format"
     
     # Try to identify the file type using several methods
     mime_type = None
     
     # Method 1: Use python-magic if available (most accurate)
-    try:
-        import magic
-        mime = magic.Magic(mime=True)
+    mime = get_magic()
+    if mime is not None:
         mime_type = mime.from_file(file_path)
         
-        if not mime_type.startswith('audio/') and not mime_type.startswith('video/'):
+        if mime_type.startswith('audio/'):
+            return True, f"File appears to be a valid audio file (MIME type: {mime_type})"
+        if not mime_type.startswith('video/'):
             return False, f"File does not appear to be audio. MIME type: {mime_type}"
-    except ImportError:
-        # Method 2: Use mimetypes library as fallback
+        # Video containers may or may not carry audio, so keep checking
+    else:
+        # Method 2: Use mimetypes library as fallback (extension based, so it can only rule files out)
         mime_type = mimetypes.guess_type(file_path)[0]
         
         if mime_type and not mime_type.startswith('audio/') and not mime_type.startswith('video/'):
             return False, f"File does not appear to be audio based on extension. Guessed MIME type: {mime_type}"
     
-    # Method 3: Try to use FFmpeg/FFprobe if available for deep inspection
-    try:
-        import subprocess
-        # Check if ffprobe is available
+    # Method 3: Inspect the container's streams in-process with PyAV (libavformat bindings),
+    # falling back to an ffprobe subprocess only if PyAV isn't installed
+    if av is not None:
+        try:
+            with av.open(file_path) as container:
+                if container.streams.audio:
+                    return True, "File appears to be a valid audio file (audio stream found by PyAV)"
+                return False, "File does not contain valid audio streams according to PyAV"
+        except Exception as e:
+            return False, f"File could not be opened as media by PyAV: {str(e)}"
+    else:
         try:
             # On Windows, we need shell=True to find executables in PATH
             use_shell = platform.system() == "Windows"
-            subprocess.run(["ffprobe", "-version"], 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE,
-                          shell=use_shell)
-            has_ffprobe = True
-        except (FileNotFoundError, subprocess.SubprocessError):
-            has_ffprobe = False
-            
-        if has_ffprobe:
-            # Use ffprobe to get stream information
             cmd = ["ffprobe", "-v", "error", "-show_entries", 
                    "stream=codec_type", "-of", "default=noprint_wrappers=1", file_path]
             result = subprocess.run(cmd, 
@@ -75,14 +107,16 @@ def validate_audio_file(file_path):
                                    text=True)
             
             # Check if it contains an audio stream
-            if "codec_type=audio" not in result.stdout:
-                return False, "File does not contain valid audio streams according to FFprobe"
-    except (ImportError, Exception) as e:
-        # If ffprobe check fails, continue to next method
-        pass
+            if "codec_type=audio" in result.stdout:
+                return True, "File appears to be a valid audio file (audio stream found by FFprobe)"
+            return False, "File does not contain valid audio streams according to FFprobe"
+        except (FileNotFoundError, subprocess.SubprocessError):
+            # ffprobe isn't available, continue to next method
+            pass
     
     # Method 4: Try to read with librosa as a final validation
-    try:
+    # (if librosa isn't available, we've done all we can with other methods)
+    if _HAS_LIBROSA:
         import librosa
         try:
             duration = librosa.get_duration(path=file_path)
@@ -90,9 +124,6 @@ def validate_audio_file(file_path):
                 return False, "File could not be read as audio by librosa (zero duration)"
         except Exception as e:
             return False, f"File could not be read as audio by librosa: {str(e)}"
-    except ImportError:
-        # If librosa isn't available, we've done all we can with other methods
-        pass
-        
+    
     # If we've made it here, the file appears to be valid audio
     return True, "File appears to be a valid audio file"
\ No newline at end of file
@@ -1,8 +1,12 @@
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from nltk.tokenize import sent_tokenize
+from _nltk_cache import split_sentences
 import nltk
 import ssl
+from transcript_cache import TranscriptCache
+
+# Indexes of recently seen transcripts: hash -> (sentences, vectorizer, sentence_vectors)
+_index_cache = TranscriptCache(max_size=32)
 
 def initialize_nltk():
     """Ensure NLTK data is downloaded"""
@@ -18,6 +22,12 @@ def initialize_nltk():
             nltk.data.find('tokenizers/punkt')
         except LookupError:
             nltk.download('punkt', quiet=True)
+            
+        # NLTK >= 3.8.2 loads Punkt from the 'punkt_tab' resource
+        try:
+            nltk.data.find('tokenizers/punkt_tab')
+        except LookupError:
+            nltk.download('punkt_tab', quiet=True)
     except Exception as e:
         print(f"Warning: NLTK initialization issue: {str(e)}")
 
@@ -46,9 +56,16 @@ class MeetingSearch:
         
         self.transcript = transcript.strip()
         
+        # Reuse the index if this transcript was indexed recently
+        cache_key = TranscriptCache.make_key(self.transcript)
+        cached = _index_cache.get(cache_key)
+        if cached is not None:
+            self.sentences, self.vectorizer, self.sentence_vectors = cached
+            return True
+        
         # Tokenize the transcript into sentences
         try:
-            self.sentences = sent_tokenize(self.transcript)
+            self.sentences = split_sentences(self.transcript)
         except Exception:
             # Fallback tokenization approach
             self.sentences = [s.strip() for s in self.transcript.split('.') if s.strip()]
@@ -58,8 +75,16 @@ class MeetingSearch:
         
         # Create TF-IDF vectors for sentences
         try:
-            self.vectorizer = TfidfVectorizer(stop_words='english')
+            # float32 halves memory traffic in the scoring product; sublinear (1 + log tf)
+            # term weighting keeps repeated words from dominating short sentences
+            self.vectorizer = TfidfVectorizer(
+                stop_words='english',
+                dtype=np.float32,
+                sublinear_tf=True,
+                norm='l2'
+            )
             self.sentence_vectors = self.vectorizer.fit_transform(self.sentences)
+            _index_cache.put(cache_key, (self.sentences, self.vectorizer, self.sentence_vectors))
             return True
         except Exception as e:
             print(f"Indexing error: {str(e)}")
@@ -89,15 +114,21 @@ class MeetingSearch:
         query = query.strip()
         
         try:
-            # Transform query using the same vectorizer
-            query_vector = self.vectorizer.transform([query])
+            # Transform query using the same vectorizer, as a dense 1-D vector
+            query_vector = self.vectorizer.transform([query]).toarray().ravel()
             
-            # Calculate similarity scores using matrix multiplication (dot product)
-            # This fixes the potential error with the @ operator
-            similarity = np.dot(self.sentence_vectors.toarray(), query_vector.toarray().T).flatten()
+            # Calculate similarity scores with a CSR matrix x dense vector product, which
+            # writes straight into a dense result without a sparse intermediate. TF-IDF
+            # rows are L2-normalized, so the dot product is the cosine similarity
+            similarity = self.sentence_vectors @ query_vector
             
-            # Get top results with non-zero scores
-            top_indices = np.argsort(similarity)[-num_results:][::-1]
+            # Get top results with non-zero scores; argpartition selects the top k
+            # in linear time so only those k scores need sorting
+            k = min(num_results, similarity.size)
+            if k <= 0:
+                return [("No matching results found.", 0.0)]
+            top_indices = np.argpartition(-similarity, k - 1)[:k]
+            top_indices = top_indices[np.argsort(-similarity[top_indices])]
             
             # Return results with scores
             results = [(self.sentences[i], float(similarity[i])) for i in top_indices if similarity[i] > 0]
@@ -131,14 +162,10 @@ class MeetingSearch:
         start = max(0, sentence_index - window)
         end = min(len(self.sentences), sentence_index + window + 1)
         
-        context = []
-        for i in range(start, end):
-            if i == sentence_index:
-                context.append(f"**{self.sentences[i]}**")  # Highlight the matching sentence
-            else:
-                context.append(self.sentences[i])
-                
-        return " ".join(context)
+        # Highlight the matching sentence between the slices before and after it
+        before = self.sentences[start:sentence_index]
+        after = self.sentences[sentence_index + 1:end]
+        return " ".join([*before, f"**{self.sentences[sentence_index]}**", *after])
     
     def get_sentence_count(self):
         """
@@ -1,8 +1,22 @@
 import nltk
 import ssl
+import functools
+import numpy as np
 from nltk.sentiment import SentimentIntensityAnalyzer
-from nltk.tokenize import sent_tokenize
-from collections import Counter
+from _nltk_cache import split_sentences
+from transcript_cache import TranscriptCache
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the aggregation runs as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Results for recently analyzed transcripts, keyed by transcript hash
+_sentiment_cache = TranscriptCache(max_size=32)
 
 def initialize_nltk():
     """
@@ -23,6 +37,12 @@ def initialize_nltk():
         except LookupError:
             nltk.download('punkt', quiet=True)
 
+        # NLTK >= 3.8.2 loads Punkt from the 'punkt_tab' resource
+        try:
+            nltk.data.find('tokenizers/punkt_tab')
+        except LookupError:
+            nltk.download('punkt_tab', quiet=True)
+
         # Download VADER lexicon if not already available
         try:
             nltk.data.find('sentiment/vader_lexicon')
@@ -32,15 +52,100 @@ def initialize_nltk():
     except Exception as e:
         print(f"Warning during NLTK initialization: {str(e)}")
 
+@functools.lru_cache(maxsize=1)
+def get_analyzer():
+    """
+    Return a shared SentimentIntensityAnalyzer, loading the VADER lexicon only once.
+    """
+    initialize_nltk()
+    return SentimentIntensityAnalyzer()
+
+@njit(cache=True)
+def aggregate_scores(compounds, pos, neg, neu):
+    """
+    Average the per-sentence VADER scores and classify each sentence in a single pass.
+
+    Returns:
+        tuple: (avg_compound, avg_pos, avg_neg, avg_neu, n_positive, n_negative, n_neutral)
+    """
+    total = compounds.shape[0]
+    sum_compound = 0.0
+    sum_pos = 0.0
+    sum_neg = 0.0
+    sum_neu = 0.0
+    n_positive = 0
+    n_negative = 0
+    n_neutral = 0
+
+    for i in range(total):
+        compound = compounds[i]
+        sum_compound += compound
+        sum_pos += pos[i]
+        sum_neg += neg[i]
+        sum_neu += neu[i]
+        if compound >= 0.05:
+            n_positive += 1
+        elif compound <= -0.05:
+            n_negative += 1
+        else:
+            n_neutral += 1
+
+    return (sum_compound / total, sum_pos / total, sum_neg / total, sum_neu / total,
+            n_positive, n_negative, n_neutral)
+
+def get_cached_sentiment(transcript):
+    """
+    Look up a transcript's sentiment analysis in this process's cache.
+
+    Args:
+        transcript (str): The transcript text.
+
+    Returns:
+        dict: The cached result, or None if the transcript hasn't been analyzed yet.
+    """
+    if not isinstance(transcript, str):
+        return None
+    return _sentiment_cache.get(TranscriptCache.make_key(transcript.strip()))
+
+def cache_sentiment(transcript, result):
+    """
+    Store a transcript's sentiment analysis in this process's cache.
+    """
+    _sentiment_cache.put(TranscriptCache.make_key(transcript.strip()), result)
+
 def analyze_sentiment(transcript):
     """
     Analyze sentiment of text using NLTK's VADER sentiment analyzer.
+    Repeated transcripts are answered from the cache.
 
     Args:
         transcript (str): The transcript text to analyze.
 
     Returns:
-        dict: A dictionary containing sentiment analysis results.
+        dict: A dictionary containing sentiment analysis results. "Positive",
+        "Negative" and "Neutral" are the fractions (0-1) of sentences with
+        that sentiment.
+    """
+    cached = get_cached_sentiment(transcript)
+    if cached is not None:
+        return cached
+
+    result, cacheable = compute_sentiment(transcript)
+    if cacheable:
+        cache_sentiment(transcript, result)
+    return result
+
+def compute_sentiment(transcript):
+    """
+    Analyze sentiment without using the cache. Worker processes run this, since
+    each process would otherwise fill its own cache.
+
+    Args:
+        transcript (str): The transcript text to analyze.
+
+    Returns:
+        tuple: (result, cacheable), where result is the analyze_sentiment dictionary
+        and cacheable is True only for a complete analysis.
     """
     initialize_nltk()
 
@@ -48,24 +153,24 @@ def analyze_sentiment(transcript):
         return {
             "Overall Sentiment": "Invalid input",
             "Error": "Input must be a string"
-        }
+        }, False
 
     transcript = transcript.strip()
     if not transcript:
         return {
             "Overall Sentiment": "Neutral",
-            "Positive": "0.0%",
-            "Negative": "0.0%",
-            "Neutral": "100.0%",
+            "Positive": 0.0,
+            "Negative": 0.0,
+            "Neutral": 1.0,
             "Compound Score": 0.0,
             "Note": "Empty input provided"
-        }
+        }, False
 
     try:
-        sia = SentimentIntensityAnalyzer()
+        sia = get_analyzer()
 
         try:
-            sentences = sent_tokenize(transcript)
+            sentences = split_sentences(transcript)
         except Exception:
             # Fallback if tokenization fails
             sentences = [s.strip() for s in transcript.split('.') if s.strip()]
@@ -73,47 +178,42 @@ def analyze_sentiment(transcript):
         if not sentences:
             return {
                 "Overall Sentiment": "Neutral",
-                "Positive": "0.0%",
-                "Negative": "0.0%",
-                "Neutral": "100.0%",
+                "Positive": 0.0,
+                "Negative": 0.0,
+                "Neutral": 1.0,
                 "Compound Score": 0.0,
                 "Note": "No sentences detected"
-            }
+            }, False
 
-        scores = []
-        sentiments = []
+        # Struct-of-arrays score storage, filled in place as sentences are scored
+        compounds = np.empty(len(sentences), dtype=np.float64)
+        pos_scores = np.empty(len(sentences), dtype=np.float64)
+        neg_scores = np.empty(len(sentences), dtype=np.float64)
+        neu_scores = np.empty(len(sentences), dtype=np.float64)
+        total = 0
 
         for sentence in sentences:
             try:
                 sentiment_score = sia.polarity_scores(sentence)
-                scores.append(sentiment_score)
-                compound = sentiment_score['compound']
-                if compound >= 0.05:
-                    sentiments.append('POSITIVE')
-                elif compound <= -0.05:
-                    sentiments.append('NEGATIVE')
-                else:
-                    sentiments.append('NEUTRAL')
             except Exception as e:
                 print(f"Sentiment analysis failed on a sentence: {e}")
+                continue
+            compounds[total] = sentiment_score['compound']
+            pos_scores[total] = sentiment_score['pos']
+            neg_scores[total] = sentiment_score['neg']
+            neu_scores[total] = sentiment_score['neu']
+            total += 1
 
-        if not scores:
+        if total == 0:
             return {
                 "Overall Sentiment": "Analysis failed",
                 "Note": "No sentiment scores could be calculated"
-            }
+            }, False
 
-        # Aggregate results
-        sentiment_counts = Counter(sentiments)
-        total = len(sentiments)
-        positive = sentiment_counts.get('POSITIVE', 0)
-        negative = sentiment_counts.get('NEGATIVE', 0)
-        neutral = sentiment_counts.get('NEUTRAL', 0)
-
-        avg_compound = sum(score['compound'] for score in scores) / total
-        avg_pos = sum(score['pos'] for score in scores) / total
-        avg_neg = sum(score['neg'] for score in scores) / total
-        avg_neu = sum(score['neu'] for score in scores) / total
+        # Aggregate results (averages and sentence classification in one pass)
+        avg_compound, avg_pos, avg_neg, avg_neu, positive, negative, neutral = aggregate_scores(
+            compounds[:total], pos_scores[:total], neg_scores[:total], neu_scores[:total]
+        )
 
         if avg_compound >= 0.05:
             overall = "Positive"
@@ -124,9 +224,9 @@ def analyze_sentiment(transcript):
 
         result = {
             "Overall Sentiment": overall,
-            "Positive": f"{positive/total:.1%}",
-            "Negative": f"{negative/total:.1%}",
-            "Neutral": f"{neutral/total:.1%}",
+            "Positive": round(positive / total, 4),
+            "Negative": round(negative / total, 4),
+            "Neutral": round(neutral / total, 4),
             "Compound Score": round(avg_compound, 2),
             "Stats": {
                 "Total Sentences": total,
@@ -141,14 +241,14 @@ def analyze_sentiment(transcript):
             }
         }
 
-        return result
+        return result, True
 
     except Exception as e:
         return {
             "Overall Sentiment": "Analysis failed",
             "Error": str(e),
             "Note": "Exception raised during sentiment analysis"
-        }
+        }, False
 
 # Test block (optional)
 if __name__ == "__main__":
@@ -4,25 +4,38 @@ from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import tempfile
+import uuid
+import aiofiles
 import os
 import json
 import asyncio
+import heapq
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import time
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from transcription import transcribe_audio, check_audio_file, convert_audio_to_wav
+from file_validation import validate_audio_file, get_magic, AUDIO_EXTENSIONS
 # Import other modules as needed
 try:
     from summarization import summarize_text
-    from sentiment import analyze_sentiment
+    from sentiment import get_cached_sentiment, cache_sentiment, compute_sentiment
     from search import index_transcript, search_meeting
 except ImportError:
     # Create placeholder functions for development/testing
     def summarize_text(text, num_points=5):
         return f"• Summary with {num_points} points would go here.\n• This is a placeholder."
         
-    def analyze_sentiment(text):
-        return {"Overall Sentiment": "Neutral", "Compound Score": 0.0, "Positive": 0.0, "Negative": 0.0, "Neutral": 1.0}
+    def get_cached_sentiment(text):
+        return None
+        
+    def cache_sentiment(text, result):
+        pass
+        
+    def compute_sentiment(text):
+        return {"Overall Sentiment": "Neutral", "Compound Score": 0.0, "Positive": 0.0, "Negative": 0.0, "Neutral": 1.0}, False
         
     def index_transcript(text):
         pass
@@ -30,13 +43,73 @@ except ImportError:
     def search_meeting(query):
         return [(f"This is a placeholder result for: {query}", 0.95)]
 
+@dataclass(slots=True)
+class JobStatus:
+    """Progress and results of a single processing job"""
+    created_at: float
+    updated_at: float
+    progress: int = 0
+    message: str = "Job started"
+    complete: bool = False
+    error: Optional[str] = None
+    results: Optional[Dict[str, Any]] = None
+
 # Status tracking dictionary
-job_status: Dict[str, Dict[str, Any]] = {}
+job_status: Dict[str, JobStatus] = {}
+
+# Jobs are removed this many seconds after creation (24 hours)
+JOB_TTL_SECONDS = 86400
+
+# Min-heap of (expiry time, job_id) so cleanup never scans all jobs
+job_expiry_heap: List[Tuple[float, str]] = []
+
+# Events used to wake clients long-polling a job's status
+job_events: Dict[str, asyncio.Event] = {}
+event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Worker processes for the CPU-bound text analysis stages, created at startup
+process_pool: Optional[ProcessPoolExecutor] = None
+
+# Upper bound for how long /job-status-wait/ holds a request open
+MAX_LONG_POLL_SECONDS = 25
+
+# Size of the chunks uploads are streamed to disk in (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+def ensure_nltk_data():
+    """Download the NLTK data used by summarization, sentiment and search if it is missing"""
+    try:
+        import nltk
+    except ImportError:
+        print("NLTK not installed, skipping NLTK data download")
+        return
+    
+    for resource, package in (
+        ("tokenizers/punkt", "punkt"),
+        ("tokenizers/punkt_tab", "punkt_tab"),
+        ("corpora/stopwords", "stopwords"),
+        ("sentiment/vader_lexicon.zip", "vader_lexicon"),
+    ):
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            try:
+                nltk.download(package, quiet=True)
+            except Exception as e:
+                print(f"Could not download NLTK data '{package}': {str(e)}")
 
 # Define lifespan context manager to replace @app.on_event
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup logic
+    global event_loop, process_pool
+    event_loop = asyncio.get_running_loop()
+    await run_in_threadpool(ensure_nltk_data)
+    # Spawn rather than fork, since the server process already runs threads
+    process_pool = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn")
+    )
     cleanup_task = asyncio.create_task(cleanup_old_jobs())
     yield
     # Shutdown logic
@@ -45,6 +118,8 @@ async def lifespan(app: FastAPI):
         await cleanup_task
     except asyncio.CancelledError:
         pass
+    process_pool.shutdown(cancel_futures=True)
+    process_pool = None
 
 # Initialize FastAPI with lifespan
 app = FastAPI(lifespan=lifespan)
@@ -75,12 +150,22 @@ async def get_options(options: Optional[str] = Form(None)):
     except:
         return SummaryOptions()
 
+def notify_job(job_id: str):
+    """Wake clients waiting on a job (safe to call from worker threads)"""
+    event = job_events.get(job_id)
+    if event is not None and event_loop is not None:
+        event_loop.call_soon_threadsafe(event.set)
+
+async def run_in_process_pool(func: Callable, *args):
+    """Run a CPU-bound function in the worker process pool so it doesn't compete for the GIL"""
+    return await asyncio.get_running_loop().run_in_executor(process_pool, func, *args)
+
 def update_status(job_id: str, progress: int, message: str):
     """Update the status of a job"""
-    if job_id in job_status:
-        job_status[job_id]["progress"] = progress
-        job_status[job_id]["message"] = message
-        job_status[job_id]["updated_at"] = time.time()
+    status = job_status.get(job_id)
+    if status is not None:
+        status.progress, status.message, status.updated_at = progress, message, time.time()
+        notify_job(job_id)
         # Print for debugging
         print(f"Job {job_id}: {progress}% - {message}")
 
@@ -118,7 +203,8 @@ async def process_audio_task(temp_audio_path: str, job_id: str, options: Summary
             raise ValueError(f"Audio conversion failed: {str(e)}")
         
         # Process the audio file with status updates
-        # Run CPU-intensive tasks in a threadpool
+        # Transcription mostly waits on the transcription service and reports progress
+        # through a callback, so it stays in the threadpool
         update_status(job_id, 25, "Starting transcription...")
         transcript = await run_in_threadpool(
             transcribe_audio, 
@@ -129,11 +215,11 @@ async def process_audio_task(temp_audio_path: str, job_id: str, options: Summary
         # Update status
         update_status(job_id, 80, "Transcription complete. Generating summary...")
         
-        # Index the transcript for searching
+        # Index the transcript for searching (in this process, where /search/ reads the index)
         await run_in_threadpool(index_transcript, transcript)
         
         # Generate summary based on options
-        summary = await run_in_threadpool(
+        summary = await run_in_process_pool(
             summarize_text,
             transcript, 
             options.num_summary_points
@@ -148,24 +234,31 @@ async def process_audio_task(temp_audio_path: str, job_id: str, options: Summary
         # Update status
         update_status(job_id, 90, "Analyzing sentiment...")
         
-        # Analyze sentiment
-        sentiment = await run_in_threadpool(analyze_sentiment, transcript)
+        # Analyze sentiment, checking this process's cache first: each pool worker has
+        # its own memory, so a cache filled inside the workers would rarely be hit
+        sentiment = get_cached_sentiment(transcript)
+        if sentiment is None:
+            sentiment, cacheable = await run_in_process_pool(compute_sentiment, transcript)
+            if cacheable:
+                cache_sentiment(transcript, sentiment)
         
         # Set complete results
         update_status(job_id, 100, "Processing complete")
-        job_status[job_id]["complete"] = True
-        job_status[job_id]["results"] = {
+        job_status[job_id].complete = True
+        job_status[job_id].results = {
             "transcript": transcript,
             "summary": summary,
             "sentiment": sentiment
         }
+        notify_job(job_id)
         
     except Exception as e:
         # Update status with error
         error_message = str(e)
         print(f"Job {job_id} error: {error_message}")
         update_status(job_id, 0, f"Error: {error_message}")
-        job_status[job_id]["error"] = error_message
+        job_status[job_id].error = error_message
+        notify_job(job_id)
     finally:
         # Clean up the temp files
         try:
@@ -183,7 +276,6 @@ async def process_audio(
     options: SummaryOptions = Depends(get_options)
 ):
     # Generate a unique job ID
-    import uuid
     job_id = str(uuid.uuid4())
     
     # Print debug info
@@ -195,24 +287,12 @@ async def process_audio(
         print(f"Warning: Content-Type '{file.content_type}' doesn't appear to be audio")
         # We'll continue but log the warning
     
-    # Read file content
-    file_content = await file.read()
-    file_size = len(file_content)
-    print(f"File size: {file_size / 1024:.2f} KB")
-    
-    if file_size == 0:
-        raise HTTPException(status_code=400, detail="File is empty (0 bytes)")
-    
-    # Determine appropriate file extension
-    extension = None
-    if file.filename:
-        # Extract extension from filename if available
-        parts = file.filename.split('.')
-        if len(parts) > 1:
-            extension = parts[-1].lower()
+    # Determine appropriate file extension from the filename if available
+    # (splitext only looks at the last suffix, e.g. "recording.final.mp3")
+    extension = os.path.splitext(file.filename or "")[1].lower().lstrip('.')
     
     # Fallback to content-type if no extension or unrecognized
-    if not extension or extension not in ['mp3', 'wav', 'm4a', 'flac', 'aac', 'ogg', 'mp4', 'wma']:
+    if f".{extension}" not in AUDIO_EXTENSIONS:
         # Extract extension from content type if possible
         if file.content_type and '/' in file.content_type:
             mime_subtype = file.content_type.split('/')[-1]
@@ -235,10 +315,20 @@ async def process_audio(
     
     print(f"Using file extension: .{extension}")
     
-    # Save the uploaded file to a temporary file with the correct extension
-    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{extension}") as temp_audio:
-        temp_audio.write(file_content)
-        temp_audio_path = temp_audio.name
+    # Stream the uploaded file to a temporary file with the correct extension,
+    # one chunk at a time so large recordings are never held in memory; writes go
+    # through aiofiles so disk I/O doesn't block the event loop
+    temp_audio_path = os.path.join(tempfile.gettempdir(), f"{uuid.uuid4().hex}.{extension}")
+    async with aiofiles.open(temp_audio_path, "wb") as temp_audio:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await temp_audio.write(chunk)
+    
+    file_size = os.path.getsize(temp_audio_path)
+    print(f"File size: {file_size / 1024:.2f} KB")
+    
+    if file_size == 0:
+        os.unlink(temp_audio_path)
+        raise HTTPException(status_code=400, detail="File is empty (0 bytes)")
     
     print(f"Saved temporary file to: {temp_audio_path}")
     
@@ -246,38 +336,28 @@ async def process_audio(
     await file.seek(0)
     
     # Try to detect file type using more methods
-    try:
-        import magic
-        mime = magic.Magic(mime=True)
+    mime = get_magic()
+    if mime is not None:
         file_type = mime.from_file(temp_audio_path)
         print(f"File MIME type detected by python-magic: {file_type}")
         
         if not file_type.startswith('audio/') and not file_type.startswith('video/'):
             print(f"Warning: File doesn't appear to be audio according to python-magic. MIME: {file_type}")
-    except ImportError:
+    else:
         print("python-magic not installed, cannot detect MIME type")
     
     # Try using the validation function
-    try:
-        from file_validation import validate_audio_file
-        is_valid, message = validate_audio_file(temp_audio_path)
-        if not is_valid:
-            print(f"Audio validation failed: {message}")
-            # We could raise an exception here, but let's try to process anyway
-            # and let the conversion/transcription handle errors
-    except ImportError:
-        print("Audio validation module not available")
+    is_valid, message = validate_audio_file(temp_audio_path)
+    if not is_valid:
+        print(f"Audio validation failed: {message}")
+        # We could raise an exception here, but let's try to process anyway
+        # and let the conversion/transcription handle errors
     
     # Initialize job status
-    job_status[job_id] = {
-        "progress": 0,
-        "message": "Job started",
-        "created_at": time.time(),
-        "updated_at": time.time(),
-        "complete": False,
-        "error": None,
-        "results": None
-    }
+    created_at = time.time()
+    job_status[job_id] = JobStatus(created_at=created_at, updated_at=created_at)
+    job_events[job_id] = asyncio.Event()
+    heapq.heappush(job_expiry_heap, (created_at + JOB_TTL_SECONDS, job_id))
     
     # Start the processing in a background task
     background_tasks.add_task(process_audio_task, temp_audio_path, job_id, options)
@@ -287,32 +367,58 @@ async def process_audio(
 
 @app.get("/job-status/{job_id}")
 async def get_job_status(job_id: str):
-    if job_id not in job_status:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
     # Get the job status
-    status = job_status[job_id]
+    status = job_status.get(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
     
     # If the job is complete or has an error, return results
-    if status["error"]:
+    if status.error:
         return {
             "status": "error",
-            "message": status["message"],
-            "error": status["error"]
+            "message": status.message,
+            "error": status.error
         }
-    elif status["complete"]:
+    elif status.complete:
         return {
             "status": "complete",
-            "results": status["results"]
+            "results": status.results
         }
     else:
         # Return progress information
         return {
             "status": "processing",
-            "progress": status["progress"],
-            "message": status["message"]
+            "progress": status.progress,
+            "message": status.message
         }
 
+@app.get("/job-status-wait/{job_id}")
+async def wait_job_status(job_id: str, since: int = -1, timeout: float = MAX_LONG_POLL_SECONDS):
+    """Long-poll variant of /job-status/ that returns once progress differs from `since`"""
+    if job_id not in job_status:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    deadline = time.time() + max(0.0, min(timeout, MAX_LONG_POLL_SECONDS))
+    
+    while True:
+        status = job_status.get(job_id)
+        if status is None or status.error or status.complete or status.progress != since:
+            break
+        
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            break
+        
+        # Wait for the next status change or the deadline
+        event = job_events.setdefault(job_id, asyncio.Event())
+        event.clear()
+        try:
+            await asyncio.wait_for(event.wait(), timeout=remaining)
+        except asyncio.TimeoutError:
+            break
+    
+    return await get_job_status(job_id)
+
 @app.post("/search/")
 async def search_transcript(search_request: SearchQuery):
     results = await run_in_threadpool(search_meeting, search_request.query)
@@ -326,19 +432,24 @@ def health_check():
 # Cleanup job function moved outside of the startup event
 async def cleanup_old_jobs():
     while True:
-        await asyncio.sleep(3600)  # Run every hour
+        # Sleep until the oldest job expires; new jobs always expire later than that
+        if job_expiry_heap:
+            await asyncio.sleep(max(1, job_expiry_heap[0][0] - time.time()))
+        else:
+            await asyncio.sleep(JOB_TTL_SECONDS)
+        
         current_time = time.time()
-        keys_to_remove = []
+        removed = 0
         
-        for job_id, status in job_status.items():
-            # Remove jobs older than 24 hours
-            if current_time - status["created_at"] > 86400:
-                keys_to_remove.append(job_id)
+        # Remove jobs older than 24 hours
+        while job_expiry_heap and job_expiry_heap[0][0] <= current_time:
+            _, job_id = heapq.heappop(job_expiry_heap)
+            if job_status.pop(job_id, None) is not None:
+                removed += 1
+            job_events.pop(job_id, None)
         
-        for job_id in keys_to_remove:
-            del job_status[job_id]
-            
-        print(f"Cleaned up {len(keys_to_remove)} old jobs")
+        if removed:
+            print(f"Cleaned up {removed} old jobs")
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,15 +1,72 @@
 import nltk
 # To upgrade pip, run the following command in your terminal or command prompt:
 # python -m pip install --upgrade pip
+import re
+import os
 import ssl
-import heapq
-from nltk.tokenize import sent_tokenize, word_tokenize
+import hashlib
+import functools
+from collections import Counter
+from itertools import chain
+import numpy as np
 from nltk.corpus import stopwords
+from _nltk_cache import split_sentences, has_punkt
+
+try:
+    import diskcache
+except ImportError:
+    # diskcache is optional; without it summaries are only cached in memory per process
+    diskcache = None
+
+# Summaries persisted across restarts, keyed by transcript and summary length. The cache
+# lives in a private per-user directory because diskcache unpickles the values it reads.
+SUMMARY_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "meeting_summarizer",
+    "summaries"
+)
+SUMMARY_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+# Part of every cache key; bump it whenever the summarization algorithm changes
+SUMMARY_CACHE_VERSION = "extractive-v1"
+
+# Word tokens for frequency counting: runs of letters/digits (what str.isalnum() accepts)
+_WORD_RE = re.compile(r"[^\W_]+")
+
+# Used when the NLTK stopwords corpus isn't available
+_FALLBACK_STOP_WORDS = frozenset({
+    "i", "me", "my", "myself", "we", "our", "ours", "ourselves", "you", "your",
+    "yours", "yourself", "yourselves", "he", "him", "his", "himself", "she", "her",
+    "hers", "herself", "it", "its", "itself", "they", "them", "their", "theirs",
+    "themselves", "what", "which", "who", "whom", "this", "that", "these", "those",
+    "am", "is", "are", "was", "were", "be", "been", "being", "have", "has", "had",
+    "having", "do", "does", "did", "doing", "a", "an", "the", "and", "but", "if", "or",
+    "because", "as", "until", "while", "of", "at", "by", "for", "with", "about",
+    "against", "between", "into", "through", "during", "before", "after", "above",
+    "below", "to", "from", "up", "down", "in", "out", "on", "off", "over", "under",
+    "again", "further", "then", "once", "here", "there", "when", "where", "why", "how",
+    "all", "any", "both", "each", "few", "more", "most", "other", "some", "such", "no",
+    "nor", "not", "only", "own", "same", "so", "than", "too", "very", "s", "t", "can",
+    "will", "just", "don", "should", "now"
+})
+
+# NLTK data used here, as (resource path, download package) pairs
+_NLTK_RESOURCES = (
+    ('tokenizers/punkt', 'punkt'),
+    ('tokenizers/punkt_tab', 'punkt_tab'),  # NLTK >= 3.8.2 loads Punkt from 'punkt_tab'
+    ('corpora/stopwords', 'stopwords'),
+)
+
+# Set once all NLTK data has been found, so later calls skip the filesystem probes
+_NLTK_READY = False
 
 def initialize_nltk():
     """
     Initialize NLTK by downloading required resources safely
     """
+    global _NLTK_READY
+    if _NLTK_READY:
+        return
+    
     try:
         # Handle SSL certificate verification issues
         try:
@@ -20,22 +77,89 @@ def initialize_nltk():
             ssl._create_default_https_context = _create_unverified_https_context
             
         # Download required NLTK data
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt', quiet=True)
-            
-        try:
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('stopwords', quiet=True)
+        for resource, package in _NLTK_RESOURCES:
+            try:
+                nltk.data.find(resource)
+            except LookupError:
+                nltk.download(package, quiet=True)
+        
+        # nltk.download returns False instead of raising when it fails, so only stop
+        # checking once every resource can actually be found
+        for resource, _ in _NLTK_RESOURCES:
+            try:
+                nltk.data.find(resource)
+            except LookupError:
+                print(f"Warning: NLTK resource '{resource}' is unavailable, will retry on the next call")
+                return
+        
+        _NLTK_READY = True
     except Exception as e:
         print(f"Warning: NLTK initialization issue: {str(e)}")
 
+@functools.lru_cache(maxsize=1)
+def get_stop_words():
+    """
+    Get the English stopwords as a frozenset, loading the NLTK corpus only once
+    
+    Returns:
+        frozenset: English stopwords
+    """
+    try:
+        return frozenset(stopwords.words('english'))
+    except Exception:
+        # Fallback if stopwords aren't available
+        return _FALLBACK_STOP_WORDS
+
+def _private_cache_dir(path):
+    """
+    Create a cache directory only the current user can access
+    
+    Returns:
+        bool: True if the directory exists, is owned by this user and is private
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if hasattr(os, "getuid"):
+        if os.stat(path).st_uid != os.getuid():
+            return False
+        os.chmod(path, 0o700)
+    return True
+
+@functools.lru_cache(maxsize=1)
+def get_summary_cache():
+    """
+    Open the on-disk summary cache once per process
+    
+    Returns:
+        diskcache.Cache: The cache, or None if diskcache isn't installed or can't be opened safely
+    """
+    if diskcache is None:
+        return None
+    try:
+        if not _private_cache_dir(SUMMARY_CACHE_DIR):
+            print(f"Warning: summary cache directory {SUMMARY_CACHE_DIR} is owned by another user, not using it")
+            return None
+        return diskcache.Cache(SUMMARY_CACHE_DIR)
+    except Exception as e:
+        print(f"Warning: could not open summary cache: {str(e)}")
+        return None
+
+def summary_cache_key(transcript, num_sentences):
+    """Cache key for a summary: algorithm version, summary length and transcript hash"""
+    digest = hashlib.sha1(transcript.encode("utf-8")).hexdigest()
+    return f"{SUMMARY_CACHE_VERSION}:{num_sentences}:{digest}"
+
+@functools.lru_cache(maxsize=256)
+def _cached_sent_tokenize(text):
+    """Split a transcript into sentences, reusing the result for repeated transcripts"""
+    return tuple(split_sentences(text))
+
 def summarize_text(transcript, num_sentences=5):
     """
     Summarize text using extractive summarization with NLTK
     
+    Summaries are cached on disk (when diskcache is installed), so repeated
+    transcripts are answered without recomputation, even after a restart.
+    
     Args:
         transcript (str): The transcript text to summarize
         num_sentences (int): Number of sentences to include in summary
@@ -43,61 +167,62 @@ def summarize_text(transcript, num_sentences=5):
     Returns:
         str: A bullet-point summary of the transcript
     """
-    # Initialize NLTK resources
+    cache = get_summary_cache() if isinstance(transcript, str) else None
+    if cache is not None:
+        key = summary_cache_key(transcript, num_sentences)
+        summary = cache.get(key)
+        if summary is not None:
+            return summary
+    
+    summary, is_fallback = _summarize(transcript, num_sentences)
+    
+    # Only cache real summaries: fallbacks, and results computed without the NLTK
+    # tokenizer or stopwords data, would otherwise stick around after the issue is fixed
+    degraded = is_fallback or not has_punkt() or get_stop_words() is _FALLBACK_STOP_WORDS
+    if cache is not None and not degraded:
+        cache.set(key, summary, expire=SUMMARY_CACHE_TTL)
+    
+    return summary
+
+def _summarize(transcript, num_sentences):
+    """
+    Compute an extractive summary
+    
+    Returns:
+        tuple: (summary, is_fallback) where is_fallback is True if one of the
+        simplified fallback methods produced the summary
+    """
+    # Initialize NLTK resources (only does work on the first call)
     initialize_nltk()
     
     # Ensure transcript is a string
     if not isinstance(transcript, str):
-        return "• Invalid transcript format"
+        return "• Invalid transcript format", True
     
     # Clean the transcript
     transcript = transcript.strip()
     if not transcript:
-        return "• No transcript content to summarize"
+        return "• No transcript content to summarize", True
     
     try:
         # Tokenize the text into sentences
-        sentences = sent_tokenize(transcript)
+        sentences = _cached_sent_tokenize(transcript)
         
         # If text is too short, return it as is
         if len(sentences) <= num_sentences:
-            return "• " + "\n• ".join(sentences)
+            return "• " + "\n• ".join(sentences), False
         
-        # Get English stopwords
-        try:
-            stop_words = set(stopwords.words('english'))
-        except Exception:
-            # Fallback if stopwords aren't available
-            stop_words = set(["i", "me", "my", "myself", "we", "our", "ours", "ourselves", 
-                             "you", "your", "yours", "yourself", "yourselves", "he", "him", 
-                             "his", "himself", "she", "her", "hers", "herself", "it", "its", 
-                             "itself", "they", "them", "their", "theirs", "themselves", "what", 
-                             "which", "who", "whom", "this", "that", "these", "those", "am", 
-                             "is", "are", "was", "were", "be", "been", "being", "have", "has", 
-                             "had", "having", "do", "does", "did", "doing", "a", "an", "the", 
-                             "and", "but", "if", "or", "because", "as", "until", "while", "of", 
-                             "at", "by", "for", "with", "about", "against", "between", "into", 
-                             "through", "during", "before", "after", "above", "below", "to", 
-                             "from", "up", "down", "in", "out", "on", "off", "over", "under", 
-                             "again", "further", "then", "once", "here", "there", "when", 
-                             "where", "why", "how", "all", "any", "both", "each", "few", 
-                             "more", "most", "other", "some", "such", "no", "nor", "not", 
-                             "only", "own", "same", "so", "than", "too", "very", "s", "t", 
-                             "can", "will", "just", "don", "should", "now"])
+        stop_words = get_stop_words()
         
-        # Tokenize words and create frequency table
-        word_frequencies = {}
+        # Tokenize all sentences in one batch with the shared precompiled pattern, keeping
+        # only the content words used for scoring
+        sentence_tokens = [
+            [word for word in words if word not in stop_words]
+            for words in map(_WORD_RE.findall, map(str.lower, sentences))
+        ]
         
-        for sentence in sentences:
-            # Handle potential tokenization errors
-            try:
-                words = word_tokenize(sentence.lower())
-            except Exception:
-                words = sentence.lower().split()
-                
-            for word in words:
-                if word not in stop_words and word.isalnum():
-                    word_frequencies[word] = word_frequencies.get(word, 0) + 1
+        # Create frequency table (chain.from_iterable keeps the whole count loop in C)
+        word_frequencies = Counter(chain.from_iterable(sentence_tokens))
         
         # Check if we have meaningful word frequencies
         if not word_frequencies:
@@ -105,45 +230,32 @@ def summarize_text(transcript, num_sentences=5):
             step = max(1, len(sentences) // num_sentences)
             selected_indices = list(range(0, len(sentences), step))[:num_sentences]
             summary_sentences = [sentences[i] for i in selected_indices]
-            return "• " + "\n• ".join(summary_sentences)
+            return "• " + "\n• ".join(summary_sentences), True
         
-        # Normalize word frequencies
-        max_frequency = max(word_frequencies.values())
-        for word in word_frequencies:
-            word_frequencies[word] = word_frequencies[word] / max_frequency
-            
-        # Calculate sentence scores
-        sentence_scores = {}
-        for i, sentence in enumerate(sentences):
-            # Handle potential tokenization errors
-            try:
-                words = word_tokenize(sentence.lower())
-            except Exception:
-                words = sentence.lower().split()
-                
-            for word in words:
-                if word in word_frequencies:
-                    sentence_scores[i] = sentence_scores.get(i, 0) + word_frequencies[word]
-        
-        # Check if we have sentence scores
-        if not sentence_scores:
-            # Simple fallback approach
-            selected_indices = [0]  # Always include first sentence
-            if len(sentences) > 1:
-                selected_indices.extend([i for i in range(1, len(sentences)) 
-                                        if i % (len(sentences) // (num_sentences-1) + 1) == 0][:num_sentences-1])
-            summary_sentences = [sentences[i] for i in selected_indices]
-            return "• " + "\n• ".join(summary_sentences)
+        # Calculate sentence scores from raw counts; normalizing by the maximum frequency
+        # scales every score by the same factor, so it can't change which sentences rank highest
+        sentence_scores = np.fromiter(
+            (sum(word_frequencies[word] for word in words) for words in sentence_tokens),
+            dtype=np.int64,
+            count=len(sentence_tokens)
+        )
         
-        # Get top sentences
-        top_sentence_indices = heapq.nlargest(num_sentences, sentence_scores, key=sentence_scores.get)
+        # Get top sentences; argpartition finds the k-th highest score in linear time without
+        # sorting every score. Sentences tied at that score are taken earliest first, so the
+        # summary doesn't depend on argpartition's arbitrary order among equal scores
+        # (sentences without any content words are never selected)
+        k = min(num_sentences, int(np.count_nonzero(sentence_scores)))
+        kth_score = sentence_scores[np.argpartition(-sentence_scores, k - 1)[k - 1]]
+        above = np.flatnonzero(sentence_scores > kth_score)
+        tied = np.flatnonzero(sentence_scores == kth_score)[:k - above.size]
+        top_sentence_indices = np.concatenate((above, tied))
         top_sentence_indices.sort()  # Sort to maintain original order
         
         # Create bullet point summary
         summary_sentences = [sentences[i] for i in top_sentence_indices]
         summary = "• " + "\n• ".join(summary_sentences)
         
-        return summary
+        return summary, False
             
     except Exception as e:
         # Fallback to simple summarization if processing fails
@@ -151,7 +263,7 @@ def summarize_text(transcript, num_sentences=5):
             # Try to break text into sentences
             sentences = transcript.split('. ')
             if len(sentences) <= 3:
-                return "• " + "\n• ".join(sentences)
+                return "• " + "\n• ".join(sentences), True
             
             # Simple fallback - take first sentence and a few spread throughout
             selected = [sentences[0]]  # Always include first sentence
@@ -164,13 +276,13 @@ def summarize_text(transcript, num_sentences=5):
                 selected.append(sentences[-1])  # Include last sentence
                 
             summary = "• " + "\n• ".join(selected)
-            return summary
+            return summary, True
         except:
             # Ultra fallback mode - just return the first part of the text
             if len(transcript) > 500:
-                return f"• {transcript[:500]}..."
+                return f"• {transcript[:500]}...", True
             else:
-                return f"• {transcript}"
+                return f"• {transcript}", True
 
 if __name__ == "__main__":
                     # Example usage of the summarization function
@@ -0,0 +1,74 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+np = pytest.importorskip("numpy")
+sf = pytest.importorskip("soundfile")
+librosa = pytest.importorskip("librosa")
+pytest.importorskip("magic")
+pytest.importorskip("assemblyai")
+
+import transcription
+
+
+def test_pcm16_wav_skips_conversion(tmp_path, monkeypatch):
+    wav_path = tmp_path / "meeting.wav"
+    sf.write(wav_path, np.zeros(16000, dtype=np.float32), 16000, format="WAV", subtype="PCM_16")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("16-bit PCM WAV input should not be converted")
+
+    monkeypatch.setattr(transcription, "convert_audio_to_wav", fail)
+    monkeypatch.setattr(transcription, "upload_converted_audio", fail)
+
+    transcribed = []
+
+    class FakeTranscript:
+        status = "completed"
+        text = "hello"
+
+    class FakeTranscriber:
+        def __init__(self, config=None):
+            pass
+
+        def transcribe(self, audio):
+            transcribed.append(audio)
+            return FakeTranscript()
+
+    monkeypatch.setattr(transcription.aai, "Transcriber", FakeTranscriber)
+
+    assert transcription.transcribe_audio(str(wav_path)) == "hello"
+    assert transcribed == [str(wav_path)]
+    assert wav_path.exists()
+
+
+@pytest.mark.parametrize("n_samples", [1000, 2 * transcription.NOISE_BLOCK_FRAMES * transcription.NOISE_HOP_LENGTH + 777])
+def test_reduce_noise_matches_full_signal_istft(tmp_path, n_samples):
+    n_fft = transcription.NOISE_FFT_SIZE
+    hop_length = transcription.NOISE_HOP_LENGTH
+
+    rng = np.random.default_rng(0)
+    audio = 0.02 * rng.standard_normal(n_samples) + 0.04 * np.sin(np.arange(n_samples) * 0.05)
+    audio = audio.astype(np.float32)
+    input_path = tmp_path / "noisy.wav"
+    output_path = tmp_path / "clean.wav"
+    sf.write(input_path, audio, 16000, subtype="FLOAT")
+
+    transcription.reduce_noise(str(input_path), str(output_path))
+    cleaned, sample_rate = sf.read(output_path, dtype="float32")
+
+    # Reference: the same spectral subtraction over one full-signal STFT
+    S = librosa.stft(audio, n_fft=n_fft, hop_length=hop_length, dtype=np.complex64)
+    power = np.abs(S[:, :transcription.NOISE_BLOCK_FRAMES]) ** 2
+    frame_energy = power.sum(axis=0)
+    noise_mask = frame_energy <= np.percentile(frame_energy, transcription.NOISE_PERCENTILE)
+    transcription._spectral_subtract(S, power[:, noise_mask].mean(axis=1, dtype=np.float32))
+    expected = librosa.istft(S, n_fft=n_fft, hop_length=hop_length, length=n_samples)
+
+    assert sample_rate == 16000
+    assert cleaned.shape == expected.shape
+    # The output is written as 16-bit PCM, so allow for quantization
+    np.testing.assert_allclose(cleaned, expected, atol=1e-4)
@@ -0,0 +1,71 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+class TranscriptCache:
+    """
+    Small thread-safe LRU cache for results computed from a transcript,
+    keyed by a hash of the transcript text
+    """
+    def __init__(self, max_size=32):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(transcript):
+        """
+        Hash a transcript into a compact cache key
+
+        Args:
+            transcript (str): The transcript text
+
+        Returns:
+            str: Hex digest identifying the transcript
+        """
+        return hashlib.blake2b(transcript.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key):
+        """
+        Look up a cached value, marking it as most recently used
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        """
+        Get cache usage statistics
+
+        Returns:
+            dict: Current size, capacity, hits and misses
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses
+            }
@@ -1,7 +1,13 @@
 import os
 import sys
 import time
+import math
+import platform
+import subprocess
+import functools
+import asyncio
 import assemblyai as aai
+import requests
 from typing import Callable, Optional
 import librosa
 import soundfile as sf
@@ -9,10 +15,128 @@ import tempfile
 import numpy
 from check_audio import check_audio_file
 
+try:
+    import aiohttp
+except ImportError:
+    # aiohttp is only needed for batch transcription with transcribe_many
+    aiohttp = None
+
+def _select_fft_backend():
+    """
+    Use an optimized FFT library for librosa's STFTs when one is installed
+    (MKL first, then FFTW), falling back to numpy's built-in FFT
+    """
+    try:
+        from mkl_fft.interfaces import numpy_fft as fftlib
+    except ImportError:
+        try:
+            import mkl_fft._numpy_fft as fftlib  # Older mkl_fft releases
+        except ImportError:
+            fftlib = None
+    
+    if fftlib is None:
+        try:
+            import pyfftw
+            import pyfftw.interfaces.numpy_fft as fftlib
+            # Keep measured plans around: reduce_noise always uses the same FFT size
+            pyfftw.config.PLANNER_EFFORT = "FFTW_MEASURE"
+            pyfftw.interfaces.cache.enable()
+            pyfftw.interfaces.cache.set_keepalive_time(60)
+        except ImportError:
+            return
+    
+    librosa.set_fftlib(fftlib)
+
+_select_fft_backend()
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    # numba is optional; without it spectral subtraction uses in-place numpy operations
+    _HAS_NUMBA = False
+
+# Spectral subtraction settings for reduce_noise
+NOISE_FFT_SIZE = 2048
+NOISE_HOP_LENGTH = 512
+NOISE_BLOCK_FRAMES = 256  # STFT frames processed per streamed block
+NOISE_PERCENTILE = 10  # Frames quieter than this energy percentile are treated as noise
+
+def _spectral_subtract_numpy(S, noise_power):
+    """
+    Scale each STFT bin in place by sqrt(max(|S|^2 - noise, 0)) / |S|, which keeps
+    the original phase without building angle/exp arrays
+    """
+    mag = numpy.abs(S)
+    gain = numpy.square(mag)
+    numpy.subtract(gain, noise_power[:, numpy.newaxis], out=gain)
+    numpy.maximum(gain, 0.0, out=gain)
+    numpy.sqrt(gain, out=gain)
+    numpy.divide(gain, mag, out=gain, where=gain > 0)
+    S *= gain
+
+if _HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _spectral_subtract(S, noise_power):
+        """Numba version of _spectral_subtract_numpy, parallel over STFT frames"""
+        for j in prange(S.shape[1]):
+            for i in range(S.shape[0]):
+                m2 = S[i, j].real ** 2 + S[i, j].imag ** 2
+                d = m2 - noise_power[i]
+                if d > 0.0:
+                    S[i, j] *= math.sqrt(d / m2)
+                else:
+                    S[i, j] = 0.0
+else:
+    _spectral_subtract = _spectral_subtract_numpy
+
+def _centered_blocks(audio_path, n_fft, hop_length, block_frames):
+    """
+    Read a file as consecutive mono blocks of block_frames STFT frames each
+    
+    The signal is zero-padded by n_fft // 2 samples on both ends and framed like
+    librosa.stft(center=True), so the streamed frames are exactly those of a
+    full-signal STFT, including the first and last ones.
+    
+    Yields:
+        numpy.ndarray: float32 samples of the next block's frames
+    """
+    pad = n_fft // 2
+    with sf.SoundFile(audio_path) as audio_file:
+        total_frames = 1 + audio_file.frames // hop_length
+        buffer = numpy.zeros(pad, dtype=numpy.float32)
+        at_end = False
+        frame = 0
+        
+        while frame < total_frames:
+            count = min(block_frames, total_frames - frame)
+            needed = (count - 1) * hop_length + n_fft
+            
+            # Top up the buffer, appending the trailing pad once the file is exhausted
+            while buffer.shape[0] < needed and not at_end:
+                data = audio_file.read(block_frames * hop_length, dtype="float32", always_2d=True)
+                if data.shape[0] == 0:
+                    at_end = True
+                    data = numpy.zeros(pad, dtype=numpy.float32)
+                else:
+                    data = data.mean(axis=1, dtype=numpy.float32)
+                buffer = numpy.concatenate((buffer, data))
+            
+            if buffer.shape[0] < needed:
+                buffer = numpy.concatenate((buffer, numpy.zeros(needed - buffer.shape[0], dtype=numpy.float32)))
+            
+            yield buffer[:needed]
+            buffer = buffer[count * hop_length:]
+            frame += count
+
 def reduce_noise(audio_path: str, output_path: str = None) -> str:
     """
     Reduces noise in an audio file using librosa and saves the output.
     If output_path is not provided, a temporary file will be created.
+    
+    The audio is streamed in blocks of NOISE_BLOCK_FRAMES STFT frames, so memory use
+    stays constant regardless of the recording's length. The output matches running
+    librosa.stft/istft (center=True) over the whole signal.
     """
     if output_path is None:
         # Create a temporary file with the .wav extension if no output path specified
@@ -20,40 +144,127 @@ def reduce_noise(audio_path: str, output_path: str = None) -> str:
         output_path = temp_file.name
         temp_file.close()
     
-    # Load audio file
-    audio_data, sample_rate = librosa.load(audio_path, sr=None)
+    n_fft = NOISE_FFT_SIZE
+    hop_length = NOISE_HOP_LENGTH
+    overlap = n_fft - hop_length
+    pad = n_fft // 2
+    
+    info = sf.info(audio_path)
+    sample_rate = info.samplerate
+    total_samples = info.frames
     
-    # Compute spectrogram
-    S_full = numpy.abs(librosa.stft(audio_data))
+    # Everything runs in single precision (float32/complex64), which is plenty for ASR input
+    # and halves memory traffic compared to librosa's float64 defaults
     
-    # Compute noise power on first few frames
-    noise_power = numpy.mean(numpy.abs(S_full[:, :10]) ** 2, axis=1)
-    noise_power = noise_power[:, numpy.newaxis]
+    # Synthesis window and its square (for the overlap-add normalization)
+    window = librosa.filters.get_window("hann", n_fft, fftbins=True).astype(numpy.float32)
+    window_sq = window ** 2
     
-    # Perform noise reduction
-    S_clean = S_full ** 2 - noise_power
-    S_clean = numpy.maximum(S_clean, 0.0)
-    S_clean = numpy.sqrt(S_clean) * numpy.exp(1.j * numpy.angle(S_full))
+    # Overlap-add state carried from one block into the next
+    carry = numpy.zeros(overlap, dtype=numpy.float32)
+    carry_norm = numpy.zeros(overlap, dtype=numpy.float32)
+    noise_power = None
+    position = 0  # Position of the next finished sample in the padded signal
     
-    # Inverse STFT
-    reduced_noise = librosa.istft(S_clean)
+    # Blocks are contiguous in STFT frames, so frame-wise processing matches a full STFT
+    blocks = _centered_blocks(audio_path, n_fft, hop_length, NOISE_BLOCK_FRAMES)
     
-    # Save the processed audio
-    sf.write(output_path, reduced_noise, sample_rate)
+    with sf.SoundFile(output_path, "w", samplerate=sample_rate, channels=1) as out_file:
+        for block in blocks:
+            # Compute spectrogram of this block (the centering pad is already in the block)
+            S_full = librosa.stft(block, n_fft=n_fft, hop_length=hop_length, center=False, dtype=numpy.complex64)
+            
+            # Compute noise power from the quietest frames of the first block, so the estimate
+            # isn't corrupted when the recording starts with speech
+            if noise_power is None:
+                power = numpy.abs(S_full) ** 2
+                frame_energy = power.sum(axis=0)
+                noise_mask = frame_energy <= numpy.percentile(frame_energy, NOISE_PERCENTILE)
+                noise_power = power[:, noise_mask].mean(axis=1, dtype=numpy.float32)
+            
+            # Perform noise reduction in place
+            _spectral_subtract(S_full, noise_power)
+            
+            # Inverse STFT by windowed overlap-add, continuing from the previous block
+            frames = librosa.get_fftlib().irfft(S_full, n=n_fft, axis=0) * window[:, numpy.newaxis]
+            n_frames = frames.shape[1]
+            signal = numpy.zeros((n_frames - 1) * hop_length + n_fft, dtype=numpy.float32)
+            norm = numpy.zeros_like(signal)
+            signal[:overlap] += carry
+            norm[:overlap] += carry_norm
+            for i in range(n_frames):
+                signal[i * hop_length:i * hop_length + n_fft] += frames[:, i]
+                norm[i * hop_length:i * hop_length + n_fft] += window_sq
+            
+            # Samples before the next block's first frame are final
+            done = n_frames * hop_length
+            carry, carry_norm = signal[done:], norm[done:]
+            _write_normalized(out_file, signal[:done], norm[:done], pad - position, pad + total_samples - position)
+            position += done
+        
+        # Flush the tail of the last block
+        _write_normalized(out_file, carry, carry_norm, pad - position, pad + total_samples - position)
     
     return output_path
 
-def convert_audio_to_wav(input_path: str, output_path: str = None) -> str:
+def _write_normalized(out_file, signal, norm, start, end):
+    """
+    Divide overlap-added samples by the summed squared window and write those in
+    [start, end), which drops the centering pad at both ends of the padded signal
+    """
+    start, end = max(0, start), max(0, end)
+    signal = signal[start:end]
+    norm = norm[start:end]
+    nonzero = norm > 1e-8
+    signal[nonzero] /= norm[nonzero]
+    out_file.write(signal)
+
+# Sample rate audio is converted to for transcription; 16kHz mono is all speech recognition needs
+ASR_SAMPLE_RATE = 16000
+
+# FFmpeg output options: denoise, normalize loudness and convert to 16-bit PCM mono
+# at ASR_SAMPLE_RATE in one pass
+FFMPEG_AUDIO_ARGS = [
+    "-vn",  # No video
+    "-af", "afftdn=nr=20:nf=-25,loudnorm=I=-16:TP=-1.5:LRA=11",  # Noise reduction, then loudness normalization
+    "-acodec", "pcm_s16le",  # 16-bit PCM
+    "-ar", str(ASR_SAMPLE_RATE),  # 16kHz sample rate
+    "-ac", "1",  # Mono
+]
+
+ASSEMBLYAI_UPLOAD_URL = "https://api.assemblyai.com/v2/upload"
+ASSEMBLYAI_TRANSCRIPT_URL = "https://api.assemblyai.com/v2/transcript"
+
+# Limits for transcribe_many: per HTTP request (including uploads), and per file overall
+BATCH_REQUEST_TIMEOUT = 30 * 60
+BATCH_TRANSCRIPTION_TIMEOUT = 2 * 60 * 60
+UPLOAD_CHUNK_SIZE = 1 << 20  # Bytes of FFmpeg output sent per upload chunk
+UPLOAD_TIMEOUT = (30, 5 * 60)  # (connect, read) seconds for the streamed upload
+
+@functools.lru_cache(maxsize=1)
+def _has_ffmpeg() -> bool:
+    """
+    Check once per process whether the ffmpeg executable can be run
+    """
+    try:
+        subprocess.run(["ffmpeg", "-version"],
+                      stdout=subprocess.DEVNULL,
+                      stderr=subprocess.DEVNULL,
+                      shell=platform.system() == "Windows",  # Need shell=True on Windows
+                      check=True)
+        return True
+    except (FileNotFoundError, subprocess.SubprocessError):
+        return False
+
+def convert_audio_to_wav(input_path: str, output_path: str = None, audio_info: Optional[dict] = None) -> str:
     """
     Converts an audio file to properly formatted WAV file that AssemblyAI can process.
     Uses FFmpeg if available for more reliable conversion, falls back to librosa.
+    Noise reduction is applied as part of the conversion.
+    If audio_info from check_audio_file is passed, its existence and size results are
+    reused instead of checking the file again.
     Returns the path to the converted file.
     """
-    import os
-    import tempfile
-    import platform
-    import subprocess
-    
     if output_path is None:
         # Create a temporary file with the .wav extension if no output path specified
         temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
@@ -61,37 +272,33 @@ def convert_audio_to_wav(input_path: str, output_path: str = None) -> str:
         temp_file.close()
     
     # Check if the source file exists and has content
-    if not os.path.exists(input_path):
+    if audio_info is not None:
+        file_exists, file_size = audio_info["file_exists"], audio_info["file_size"]
+    else:
+        file_exists = os.path.exists(input_path)
+        file_size = os.path.getsize(input_path) if file_exists else 0
+    
+    if not file_exists:
         raise FileNotFoundError(f"Audio file not found: {input_path}")
     
-    if os.path.getsize(input_path) == 0:
+    if file_size == 0:
         raise ValueError("Audio file is empty (0 bytes)")
     
     # First, try using FFmpeg for conversion (most reliable)
     try:
         # Check if ffmpeg is available
         use_shell = platform.system() == "Windows"  # Need shell=True on Windows
-        try:
-            subprocess.run(["ffmpeg", "-version"], 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE,
-                          shell=use_shell)
-            has_ffmpeg = True
-        except (FileNotFoundError, subprocess.SubprocessError):
-            has_ffmpeg = False
+        has_ffmpeg = _has_ffmpeg()
         
         if has_ffmpeg:
             print(f"Using FFmpeg to convert {input_path} to {output_path}")
             
-            # FFmpeg command: convert to 16-bit PCM WAV at 44.1kHz
+            # FFmpeg command: denoise and convert to a WAV file
             cmd = [
                 "ffmpeg", 
                 "-y",  # Overwrite output file if it exists
                 "-i", input_path,  # Input file
-                "-vn",  # No video
-                "-acodec", "pcm_s16le",  # 16-bit PCM
-                "-ar", "44100",  # 44.1kHz sample rate
-                "-ac", "1",  # Mono
+                *FFMPEG_AUDIO_ARGS,
                 output_path  # Output file
             ]
             
@@ -119,18 +326,19 @@ def convert_audio_to_wav(input_path: str, output_path: str = None) -> str:
     try:
         print(f"Using librosa to convert {input_path}")
         
-        # Load audio with librosa (handles many formats)
-        audio_data, sample_rate = librosa.load(input_path, sr=None, mono=True)
+        # Load audio with librosa (handles many formats), resampling to the ASR rate while loading
+        audio_data, sample_rate = librosa.load(input_path, sr=ASR_SAMPLE_RATE, mono=True)
         
         # Check for valid audio data
         if len(audio_data) == 0:
             raise ValueError("No audio data found in file")
-            
-        # Ensure the sample rate is supported by AssemblyAI (they support 8kHz - 48kHz)
-        if sample_rate < 8000:
-            # Resample to 16kHz if too low
-            audio_data = librosa.resample(audio_data, orig_sr=sample_rate, target_sr=16000)
-            sample_rate = 16000
+        
+        # Reduce noise if noisereduce is available (FFmpeg's afftdn does this otherwise)
+        try:
+            import noisereduce
+            audio_data = noisereduce.reduce_noise(y=audio_data, sr=sample_rate, n_jobs=-1)
+        except ImportError:
+            print("noisereduce not installed, skipping noise reduction")
         
         # Write out as WAV with specific parameters AssemblyAI expects
         sf.write(
@@ -157,6 +365,61 @@ def convert_audio_to_wav(input_path: str, output_path: str = None) -> str:
                 pass
         raise ValueError(f"Audio conversion failed: {str(e)}")
 
+def get_api_key() -> str:
+    """
+    Get the AssemblyAI API key from the environment
+    """
+    # Load API key from environment variable
+    api_key = os.getenv("ASSEMBLYAI_API_KEY")
+    
+    # If not found, use a default API key as fallback
+    if not api_key:
+        api_key = "your api key"  # Your API key from the example
+    
+    return api_key
+
+def upload_converted_audio(input_path: str, api_key: str) -> str:
+    """
+    Convert an audio file with FFmpeg and stream the WAV output straight into
+    AssemblyAI's upload endpoint, so the converted audio never touches the disk.
+    Returns the upload URL to transcribe.
+    """
+    cmd = [
+        "ffmpeg",
+        "-v", "error",
+        "-i", input_path,
+        *FFMPEG_AUDIO_ARGS,
+        "-f", "wav",
+        "pipe:1"  # Write to stdout
+    ]
+    
+    # FFmpeg's errors go to a temp file so a full stderr pipe can never stall the upload
+    with tempfile.TemporaryFile() as ffmpeg_errors:
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=ffmpeg_errors,
+            shell=platform.system() == "Windows"
+        )
+        try:
+            # A generator body is sent with chunked transfer encoding as FFmpeg produces it
+            response = requests.post(
+                ASSEMBLYAI_UPLOAD_URL,
+                headers={"authorization": api_key},
+                data=iter(lambda: process.stdout.read(UPLOAD_CHUNK_SIZE), b""),
+                timeout=UPLOAD_TIMEOUT
+            )
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+        
+        if returncode != 0:
+            ffmpeg_errors.seek(0)
+            raise ValueError(f"FFmpeg conversion failed: {ffmpeg_errors.read().decode(errors='replace')}")
+    
+    response.raise_for_status()
+    return response.json()["upload_url"]
+
 def transcribe_audio(audio_path: str, status_callback: Optional[Callable] = None):
     """
     Transcribe audio with AssemblyAI using the modern SDK with progress reporting
@@ -185,36 +448,69 @@ def transcribe_audio(audio_path: str, status_callback: Optional[Callable] = None
         status_callback(8, "Checking audio file format...")
     
     audio_info = check_audio_file(audio_path)
-    if audio_info["error"]:
-        if status_callback:
-            status_callback(10, f"Converting audio to WAV format (original had issues: {audio_info['error']})")
-    else:
-        if status_callback:
-            status_callback(10, f"Audio file looks valid: {audio_info['duration']:.2f}s, {audio_info['sample_rate']}Hz, {audio_info['channels']} channel(s)")
+    audio_issues = "; ".join(audio_info["issues"])
     
-    # Always convert the audio to a properly formatted WAV file
+    # Read the format details from the file header when soundfile understands it
     try:
-        wav_audio_path = convert_audio_to_wav(audio_path)
-        if status_callback:
-            status_callback(15, "Audio converted to WAV format successfully")
-    except Exception as e:
+        sound_info = sf.info(audio_path)
+    except Exception:
+        sound_info = None
+    
+    if audio_issues:
         if status_callback:
-            status_callback(0, f"Audio conversion failed: {str(e)}")
-        raise ValueError(f"Failed to convert audio format: {str(e)}")
-
-    # Verify the WAV file
-    wav_info = check_audio_file(wav_audio_path)
-    if wav_info["error"]:
+            status_callback(10, f"Converting audio to WAV format (original had issues: {audio_issues})")
+    elif sound_info is not None:
         if status_callback:
-            status_callback(0, f"WAV conversion produced invalid file: {wav_info['error']}")
-        raise ValueError(f"WAV conversion produced invalid file: {wav_info['error']}")
+            status_callback(10, f"Audio file looks valid: {sound_info.duration:.2f}s, {sound_info.samplerate}Hz, {sound_info.channels} channel(s)")
     
-    # Load API key from environment variable
-    api_key = os.getenv("ASSEMBLYAI_API_KEY")
+    # 16-bit PCM WAV within AssemblyAI's supported sample rates (8kHz - 48kHz) is uploaded as is.
+    # This is decided from the header soundfile parsed, which is authoritative for WAV files;
+    # denoising and loudness normalization are deliberately skipped for such input.
+    already_wav = (
+        sound_info is not None
+        and sound_info.format == "WAV"
+        and sound_info.subtype == "PCM_16"
+        and 8000 <= sound_info.samplerate <= 48000
+    )
     
-    # If not found, use a default API key as fallback
-    if not api_key:
-        api_key = "your api key"  # Your API key from the example
+    api_key = get_api_key()
+    
+    wav_audio_path = audio_path
+    upload_url = None
+    
+    if already_wav:
+        if status_callback:
+            status_callback(15, "Audio is already 16-bit PCM WAV, skipping conversion")
+    elif _has_ffmpeg():
+        # Convert with FFmpeg and upload the output as it is produced
+        try:
+            if status_callback:
+                status_callback(12, "Converting and uploading audio...")
+            upload_url = upload_converted_audio(audio_path, api_key)
+            if status_callback:
+                status_callback(15, "Audio converted and uploaded successfully")
+        except requests.Timeout as e:
+            print(f"Streaming FFmpeg upload timed out: {str(e)}, converting to a WAV file instead")
+        except Exception as e:
+            print(f"Streaming FFmpeg upload failed: {str(e)}, converting to a WAV file instead")
+    
+    if not already_wav and upload_url is None:
+        # Convert the audio to a properly formatted WAV file
+        try:
+            wav_audio_path = convert_audio_to_wav(audio_path, audio_info=audio_info)
+            if status_callback:
+                status_callback(15, "Audio converted to WAV format successfully")
+        except Exception as e:
+            if status_callback:
+                status_callback(0, f"Audio conversion failed: {str(e)}")
+            raise ValueError(f"Failed to convert audio format: {str(e)}")
+        
+        # Sanity-check the WAV file; both conversion paths already verified their output,
+        # so a full check_audio_file pass would only repeat that work
+        if os.path.getsize(wav_audio_path) <= 1000:
+            if status_callback:
+                status_callback(0, "WAV conversion produced an invalid (nearly empty) file")
+            raise ValueError("WAV conversion produced an invalid (nearly empty) file")
     
     # Configure the AssemblyAI client
     aai.settings.api_key = api_key
@@ -235,8 +531,8 @@ def transcribe_audio(audio_path: str, status_callback: Optional[Callable] = None
         if status_callback:
             status_callback(40, "Submitting audio for transcription...")
         
-        # Directly transcribe the file (simplified approach)
-        transcript = transcriber.transcribe(wav_audio_path)
+        # Transcribe the streamed upload, or let the SDK upload the file itself
+        transcript = transcriber.transcribe(upload_url or wav_audio_path)
         
         # Check for completion status
         if transcript.status == aai.TranscriptStatus.error:
@@ -262,6 +558,87 @@ def transcribe_audio(audio_path: str, status_callback: Optional[Callable] = None
             status_callback(0, f"Transcription error: {str(e)}")
         raise e
     
+async def transcribe_audio_async(audio_path: str, session, api_key: str,
+                                 max_poll_interval: float = 15.0,
+                                 max_wait: float = BATCH_TRANSCRIPTION_TIMEOUT) -> str:
+    """
+    Transcribe one audio file with AssemblyAI's REST API without blocking the event loop
+    
+    Args:
+        audio_path: Path to audio file (any format AssemblyAI accepts)
+        session: aiohttp.ClientSession used for the requests
+        api_key: AssemblyAI API key
+        max_poll_interval: Longest wait in seconds between status checks
+        max_wait: Seconds to wait for the transcript before giving up
+    """
+    headers = {"authorization": api_key}
+    
+    # Upload the file
+    with open(audio_path, "rb") as audio_file:
+        async with session.post(ASSEMBLYAI_UPLOAD_URL, headers=headers, data=audio_file) as response:
+            response.raise_for_status()
+            upload_url = (await response.json())["upload_url"]
+    
+    # Request the transcription with the same settings as transcribe_audio
+    request = {"audio_url": upload_url, "speech_model": "best", "language_detection": True}
+    async with session.post(ASSEMBLYAI_TRANSCRIPT_URL, headers=headers, json=request) as response:
+        response.raise_for_status()
+        transcript_id = (await response.json())["id"]
+    
+    # Poll for the result, backing off exponentially, until the deadline
+    deadline = time.monotonic() + max_wait
+    poll_interval = 1.0
+    while True:
+        async with session.get(f"{ASSEMBLYAI_TRANSCRIPT_URL}/{transcript_id}", headers=headers) as response:
+            response.raise_for_status()
+            transcript = await response.json()
+        
+        if transcript["status"] == "completed":
+            return transcript["text"]
+        if transcript["status"] == "error":
+            raise Exception(f"Transcription failed: {transcript.get('error', 'Unknown error')}")
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Transcription {transcript_id} not finished after {max_wait:.0f} seconds")
+        await asyncio.sleep(min(poll_interval, remaining))
+        poll_interval = min(poll_interval * 2, max_poll_interval)
+
+def transcribe_many(audio_paths, concurrency: int = 8) -> dict:
+    """
+    Transcribe several audio files concurrently
+    
+    Args:
+        audio_paths: Paths of the audio files to transcribe
+        concurrency: Maximum number of files being uploaded/transcribed at once
+        
+    Returns:
+        dict: Maps each path to its transcript text, or to the exception raised for it
+        (a path listed more than once is transcribed once)
+    """
+    if aiohttp is None:
+        raise ImportError("aiohttp is required for transcribe_many")
+    
+    # Materialize the paths: they are iterated twice, and duplicates would collapse in the result
+    audio_paths = list(dict.fromkeys(audio_paths))
+    
+    api_key = get_api_key()
+    
+    async def run_all():
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        # Bound every individual request so a stalled connection can't hang the batch
+        timeout = aiohttp.ClientTimeout(total=BATCH_REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async def transcribe_one(path):
+                async with semaphore:
+                    return await transcribe_audio_async(path, session, api_key)
+            
+            return await asyncio.gather(*(transcribe_one(path) for path in audio_paths),
+                                        return_exceptions=True)
+    
+    return dict(zip(audio_paths, asyncio.run(run_all())))
+    
 if __name__ == "__main__":
             import sys
             
@@ -298,13 +675,8 @@ if __name__ == "__main__":
                     print(f"File does not exist: {audio_file}")
                     sys.exit(1)
                 
-                # Apply noise reduction
-                print("\nApplying noise reduction...")
-                denoised_audio = reduce_noise(audio_file)
-                print("Noise reduction completed")
-                
-                # Transcribe the denoised audio
-                result = transcribe_audio(denoised_audio, print_status)
+                # Transcribe the audio (noise reduction happens during conversion)
+                result = transcribe_audio(audio_file, print_status)
                 print("\nTranscription result:")
                 print(result)
                 
@@ -314,9 +686,5 @@ if __name__ == "__main__":
                     f.write(result)
                 print(f"\nTranscript saved to: {transcript_file}")
                 
-                # Clean up temporary denoised file
-                if os.path.exists(denoised_audio):
-                    os.remove(denoised_audio)
-                
             except Exception as e:
                 print(f"\nError: {str(e)}")
\ No newline at end of file